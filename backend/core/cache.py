@@ -0,0 +1,106 @@
+"""
+프로세스 내 캐시 유틸리티 모듈
+TTL 만료와 크기 제한(LRU) 기반 제거를 지원하는 스레드 안전 캐시
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    TTL + LRU 캐시
+
+    - 항목은 저장 후 ttl초가 지나면 만료됩니다.
+    - maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    - 동기 라우터가 스레드풀에서 실행되므로 모든 연산은 락으로 보호합니다.
+    - clear()마다 generation이 증가합니다. 조회 시작 시점의 generation을
+      set()에 넘기면, 조회 도중 무효화가 일어난 경우 오래된 값을 저장하지 않습니다.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        generation: Optional[int] = None,
+        ttl: Optional[float] = None
+    ) -> None:
+        """값 저장 (ttl을 주면 이 항목만 기본 ttl 대신 사용)"""
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._store(key, value, ttl)
+
+    def add(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> bool:
+        """키가 없거나 만료된 경우에만 저장 (저장했으면 True, 확인과 저장이 원자적)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return False
+            self._store(key, value, ttl)
+            return True
+
+    def _store(self, key: Hashable, value: Any, ttl: Optional[float]) -> None:
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """캐시에 없으면 factory()로 값을 만들어 저장 후 반환"""
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            generation = self.generation
+            value = factory()
+            self.set(key, value, generation)
+        return value
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.generation += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,148 @@
+"""
+응답 압축 미들웨어 모듈
+Accept-Encoding에 따라 brotli/gzip으로 압축하고, ETag가 있는 GET 응답은
+압축 결과를 캐시해 같은 본문을 두 번 압축하지 않습니다.
+"""
+import gzip
+from typing import List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.cache import TTLCache
+from core.config import settings
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip만 사용
+    brotli = None
+
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# 이 크기(바이트) 이상의 본문은 스레드풀에서 압축 (미들웨어는 이벤트 루프에서 실행되므로
+# 큰 목록/내보내기 응답을 압축하는 동안 다른 요청이 멈추지 않도록 함)
+THREADPOOL_MIN_SIZE = 64 * 1024
+
+_COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "image/svg+xml")
+
+# (path, query, etag, encoding) -> 압축된 본문
+compression_cache = TTLCache(
+    maxsize=settings.COMPRESSION_CACHE_MAXSIZE,
+    ttl=settings.COMPRESSION_CACHE_TTL_SECONDS
+)
+
+
+def _supported_encodings() -> List[str]:
+    # 같은 q 값이면 앞쪽을 우선 (brotli가 JSON 텍스트에서 더 작음)
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Accept-Encoding 헤더의 q 값을 고려해 사용할 인코딩 선택 (없으면 None)"""
+    if not accept_encoding:
+        return None
+
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best: Optional[Tuple[float, str]] = None
+    for encoding in _supported_encodings():
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > 0 and (best is None or q > best[0]):
+            best = (q, encoding)
+    return best[1] if best else None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+def _is_compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    return content_type.startswith(_COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """
+    ASGI 응답 압축 미들웨어
+
+    - minimum_size 미만의 본문과 스트리밍 응답(more_body)은 그대로 전달합니다.
+    - 압축된 응답의 ETag는 약한(W/) ETag로 바꿔 원본 표현과 구분합니다.
+      (etag_matches가 W/를 무시하므로 If-None-Match 조건부 요청은 그대로 동작)
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        pending_start: Optional[Message] = None
+
+        async def send_with_compression(message: Message) -> None:
+            nonlocal pending_start
+            if message["type"] == "http.response.start":
+                # 본문 첫 조각을 보고 압축 여부를 정할 때까지 헤더 전송을 보류
+                pending_start = message
+                return
+            if message["type"] != "http.response.body" or pending_start is None:
+                await send(message)
+                return
+
+            start, pending_start = pending_start, None
+            headers = MutableHeaders(scope=start)
+            body = message.get("body", b"")
+
+            if message.get("more_body", False) or not _is_compressible(headers):
+                await send(start)
+                await send(message)
+                return
+
+            headers.add_vary_header("Accept-Encoding")
+            if encoding is None or len(body) < self.minimum_size:
+                await send(start)
+                await send(message)
+                return
+
+            etag = headers.get("etag")
+            cacheable = etag is not None and scope["method"] == "GET" and start["status"] == 200
+            key = (scope["path"], scope.get("query_string", b""), etag, encoding)
+            compressed = compression_cache.get(key) if cacheable else None
+            if compressed is None:
+                generation = compression_cache.generation
+                if len(body) >= THREADPOOL_MIN_SIZE:
+                    compressed = await run_in_threadpool(compress, body, encoding)
+                else:
+                    compressed = compress(body, encoding)
+                if cacheable:
+                    compression_cache.set(key, compressed, generation)
+
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            if etag is not None and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_with_compression)
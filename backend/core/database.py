@@ -1,19 +1,37 @@
+from fastapi import Depends
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from typing import Generator
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
+from typing import Any, AsyncGenerator, Callable, Dict, Generator, TypeVar
 
 from core.config import settings
 from core.logger import logger
+from core.pool_metrics import instrument_engine, pool_class_for
 
 database_url = settings.get_database_url()
 
-engine = create_engine(
-    database_url,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10
-)
+
+def _pool_options(url: str, async_engine: bool = False) -> Dict[str, Any]:
+    """Settings의 DB_POOL_* 값으로 풀 옵션 구성 (QueuePool이 아닌 풀은 크기 옵션 제외)"""
+    options: Dict[str, Any] = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    poolclass = pool_class_for(url, async_engine)
+    if poolclass is not None:
+        options.update(
+            poolclass=poolclass,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT
+        )
+    return options
+
+
+engine = create_engine(database_url, **_pool_options(database_url))
+instrument_engine(engine, "sync")
 
 
 def test_connection() -> bool:
@@ -37,3 +55,65 @@ def get_db() -> Generator:
     finally:
         db.close()
 
+
+# settings.DB_ASYNC일 때만 생성 (asyncpg 드라이버는 이때만 필요)
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.DB_ASYNC:
+    async_database_url = settings.get_async_database_url()
+    async_engine_options = _pool_options(async_database_url, async_engine=True)
+    if settings.use_pooler:
+        # Supabase 풀러(트랜잭션 모드)는 prepared statement를 연결 간에 공유하지 못함
+        async_engine_options["connect_args"] = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+    
+    async_engine = create_async_engine(async_database_url, **async_engine_options)
+    instrument_engine(async_engine.sync_engine, "async")
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+
+async def get_async_db() -> AsyncGenerator:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+T = TypeVar("T")
+
+
+class DBRunner:
+    """
+    서비스 함수(fn(db, *args))를 설정된 DB 스택에서 실행하는 비동기 실행기
+    
+    - 동기 모드: 기존 Session으로 스레드풀에서 실행
+    - 비동기 모드: AsyncSession.run_sync로 이벤트 루프에서 실행 (I/O는 asyncpg가 await)
+    
+    서비스 함수는 동기/비동기 모드에서 같은 구현(쿼리, 캐시)을 공유합니다.
+    
+    비동기 모드에서 await되는 것은 드라이버 I/O뿐이고, fn 안의 pydantic 검증, 스냅샷 JSON
+    인코딩, 검색/패싯 색인 생성, ETag 해시 계산은 이벤트 루프를 점유합니다. 이 작업들은
+    캐시 미스일 때만 실행되지만, 그동안에는 다른 요청도 처리되지 않습니다. 따라서 비동기 모드는
+    캐시 적중률이 높고 DB 대기가 대부분인(I/O 위주) 배포에만 사용하고, 그 외에는 기본값인
+    동기 모드를 사용합니다. 두 모드 비교: python -m scripts.benchmark_db_modes
+    """
+    
+    def __init__(self, db: Any):
+        self.db = db
+    
+    async def __call__(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        if isinstance(self.db, AsyncSession):
+            return await self.db.run_sync(fn, *args, **kwargs)
+        return await run_in_threadpool(fn, self.db, *args, **kwargs)
+
+
+if settings.DB_ASYNC:
+    async def get_db_runner(db: AsyncSession = Depends(get_async_db)) -> DBRunner:
+        return DBRunner(db)
+else:
+    def get_db_runner(db: Session = Depends(get_db)) -> DBRunner:
+        return DBRunner(db)
+
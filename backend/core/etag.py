@@ -0,0 +1,45 @@
+"""
+ETag / If-None-Match 조건부 GET 유틸리티 모듈
+"""
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response
+
+from core.config import settings
+
+
+def make_etag(*parts: Any) -> str:
+    """행의 식별자/타임스탬프 등으로 강한(strong) ETag 생성"""
+    raw = "|".join(str(part) for part in (settings.VERSION, *parts))
+    digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 etag와 일치하는지 확인 (If-None-Match는 약한 비교 사용)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    # 브라우저/CDN이 매번 재검증하도록 함 (304로 본문 전송을 생략)
+    response.headers["Cache-Control"] = "no-cache"
+
+
+def not_modified(etag: str) -> Response:
+    """본문 직렬화 없이 304 응답 반환"""
+    response = Response(status_code=304)
+    set_etag(response, etag)
+    return response
@@ -22,6 +22,22 @@ class ValidationException(BaseAPIException):
         )
 
 
+class ForbiddenException(BaseAPIException):
+    def __init__(self, detail: str = "Forbidden"):
+        super().__init__(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=detail
+        )
+
+
+class ConflictException(BaseAPIException):
+    def __init__(self, detail: str):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=detail
+        )
+
+
 class DatabaseException(BaseAPIException):
     def __init__(self, detail: str = "Database operation failed"):
         super().__init__(
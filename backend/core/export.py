@@ -0,0 +1,129 @@
+"""
+스트리밍 내보내기 유틸리티 모듈
+쿼리 결과를 서버 측 커서(yield_per)로 나눠 읽으면서 NDJSON 또는 CSV 바이트 청크로 변환합니다.
+테이블 크기와 무관하게 메모리 사용량이 일정하고, 첫 행을 읽는 즉시 전송을 시작합니다.
+"""
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, Type
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Query, Session
+
+from core.database import SessionLocal
+from core.exceptions import ValidationException
+from core.logger import logger
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# 서버 측 커서에서 한 번에 가져올 행 수
+YIELD_PER = 1000
+# 이 크기(바이트)만큼 모이면 청크 하나로 전송
+CHUNK_SIZE = 64 * 1024
+# 스프레드시트가 수식으로 실행하는 셀의 첫 글자 (CSV 인젝션)
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_cell(value: Any) -> Any:
+    """
+    리스트/객체 값은 JSON 문자열로 한 셀에 저장
+
+    문의 내용 등 사용자가 입력한 문자열이 수식으로 실행되지 않도록 '를 앞에 붙입니다.
+    """
+    if isinstance(value, (list, dict)):
+        value = json.dumps(value, ensure_ascii=False)
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def iter_export(
+    build_query: Callable[[Session], Query],
+    to_model: Callable[[Any], BaseModel],
+    model: Type[BaseModel],
+    export_format: str
+) -> Iterator[bytes]:
+    """
+    쿼리 결과를 NDJSON/CSV 바이트 청크로 스트리밍
+
+    StreamingResponse 본문은 요청 의존성(get_db)의 세션이 닫힌 뒤에 실행되므로
+    제너레이터가 자체 세션을 열고 닫습니다.
+
+    도중에 행 변환/조회가 실패하면 200 헤더는 이미 전송된 뒤이므로, 오류를 기록하고
+    예외를 다시 던져 서버가 마지막 청크 없이 연결을 끊게 합니다.
+    클라이언트는 잘린 파일을 정상 완료로 받지 않고 불완전한 응답 오류를 받습니다.
+
+    Args:
+        build_query: 세션을 받아 정렬/필터가 적용된 ORM 쿼리를 만드는 함수
+        to_model: ORM 행 -> 응답 스키마 변환 함수
+        model: 응답 스키마 (CSV 헤더 순서)
+        export_format: "ndjson" 또는 "csv"
+    """
+    buffer = io.StringIO()
+    writer = None
+    if export_format == "csv":
+        # 엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 추가
+        buffer.write("\ufeff")
+        fieldnames = [info.alias or name for name, info in model.model_fields.items()]
+        writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+        # 헤더를 먼저 보내 클라이언트가 바로 다운로드를 시작하도록 함
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+    db = SessionLocal()
+    exported = 0
+    try:
+        for row in build_query(db).yield_per(YIELD_PER):
+            item = to_model(row)
+            if writer is None:
+                buffer.write(item.model_dump_json(by_alias=True))
+                buffer.write("\n")
+            else:
+                data: Dict[str, Any] = item.model_dump(mode="json", by_alias=True)
+                writer.writerow({key: _csv_cell(value) for key, value in data.items()})
+            exported += 1
+
+            if exported == 1 or buffer.tell() >= CHUNK_SIZE:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+    except Exception as e:
+        logger.error(f"내보내기 중단 ({export_format}, {exported}행 처리 후 {exported + 1}번째 행에서 실패): {str(e)}")
+        raise
+    finally:
+        db.close()
+
+
+def export_response(
+    build_query: Callable[[Session], Query],
+    to_model: Callable[[Any], BaseModel],
+    model: Type[BaseModel],
+    export_format: str,
+    name: str
+) -> StreamingResponse:
+    """
+    내보내기 StreamingResponse 생성 (파일명: {name}-{UTC 날짜}.{형식})
+
+    Raises:
+        ValidationException: 지원하지 않는 형식
+    """
+    if export_format not in EXPORT_MEDIA_TYPES:
+        raise ValidationException(f"format must be one of: {', '.join(EXPORT_MEDIA_TYPES)}")
+
+    filename = f"{name}-{datetime.now(timezone.utc):%Y%m%d}.{export_format}"
+    return StreamingResponse(
+        iter_export(build_query, to_model, model, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
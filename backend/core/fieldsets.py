@@ -0,0 +1,72 @@
+"""
+희소 필드셋(?fields=) 유틸리티 모듈
+요청한 필드만 담는 부분 응답 모델을 만들고 JSON으로 인코딩합니다.
+"""
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter, create_model
+
+from core.exceptions import ValidationException
+
+
+def _serialized_names(model: Type[BaseModel]) -> Dict[str, str]:
+    """응답 JSON 키(alias가 있으면 alias) -> 모델 필드명"""
+    names: Dict[str, str] = {}
+    for name, info in model.model_fields.items():
+        names[info.alias or name] = name
+        names.setdefault(name, name)
+    return names
+
+
+def parse_fields(fields: Optional[str], model: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    콤마로 구분된 fields 파라미터를 검증해 모델 필드명 튜플로 변환
+
+    Args:
+        fields: 예) "id,title,technologies" (None이면 전체 필드)
+        model: 검증 기준이 되는 응답 스키마
+
+    Returns:
+        요청 순서를 유지한 모델 필드명 튜플 또는 None
+    """
+    if fields is None:
+        return None
+
+    allowed = _serialized_names(model)
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    if not requested:
+        raise ValidationException("fields must not be empty")
+
+    unknown = [f for f in requested if f not in allowed]
+    if unknown:
+        raise ValidationException(
+            f"Unknown fields: {', '.join(unknown)}. "
+            f"Allowed: {', '.join(info.alias or name for name, info in model.model_fields.items())}"
+        )
+
+    return tuple(dict.fromkeys(allowed[f] for f in requested))
+
+
+@lru_cache(maxsize=256)
+def partial_model(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """model에서 fields만 남긴 부분 응답 모델 생성 (필드 조합별로 캐시)"""
+    return create_model(
+        f"{model.__name__}Partial",
+        __config__=model.model_config,
+        **{name: (model.model_fields[name].annotation, model.model_fields[name]) for name in fields}
+    )
+
+
+@lru_cache(maxsize=256)
+def _adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+def json_response(value: Any, annotation: Any) -> Response:
+    """response_model을 거치지 않고 annotation 기준으로 바로 JSON 인코딩"""
+    return Response(
+        content=_adapter(annotation).dump_json(value, by_alias=True),
+        media_type="application/json"
+    )
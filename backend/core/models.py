@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, JSON, Boolean, Date
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, JSON, Boolean, Date, Index
 from sqlalchemy.sql import func
 from core.database import Base
 
@@ -34,6 +34,17 @@ class Project(Base):
     client = Column(String(200), nullable=True)  # 외주회사명
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    __table_args__ = (
+        # 목록 정렬(priority desc, created_at desc, id desc) 키셋 페이지네이션용
+        Index("idx_projects_list_order", priority.desc(), created_at.desc(), id.desc()),
+        Index("idx_projects_type_list_order", project_type, priority.desc(), created_at.desc(), id.desc()),
+        # 시딩/가져오기 upsert의 자연 키 (priority 0은 미지정으로 보고 중복 허용)
+        Index(
+            "uq_projects_priority", priority, unique=True,
+            postgresql_where=priority > 0, sqlite_where=priority > 0
+        ),
+    )
 
 
 class Course(Base):
@@ -57,8 +68,30 @@ class Course(Base):
     what_you_learn = Column(JSON)
     curriculum = Column(JSON)
     requirements = Column(JSON)
+    # curriculum에서 쓰기 시점에 계산한 통계 (courses.curriculum.compute_curriculum_stats)
+    lesson_count = Column(Integer, nullable=False, default=0, server_default="0")
+    free_lesson_count = Column(Integer, nullable=False, default=0, server_default="0")
+    total_duration_seconds = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    __table_args__ = (
+        # 강의 목록 정렬(created_at desc)용
+        Index("idx_courses_created_at", created_at.desc(), id.desc()),
+    )
+
+
+class CourseCounterFlush(Base):
+    """반영이 끝난 강의 카운터 flush token (courses.counters, 같은 묶음의 중복 반영 방지)"""
+    __tablename__ = "course_counter_flushes"
+    
+    id = Column(String(64), primary_key=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        # 오래된 token 정리용
+        Index("idx_course_counter_flushes_created_at", created_at),
+    )
 
 
 class Inquiry(Base):
@@ -75,6 +108,16 @@ class Inquiry(Base):
     additional_features = Column(Text, nullable=True)
     estimated_price = Column(Integer, nullable=True)
     status = Column(String(20), default="pending")
+    # 클라이언트에 돌려주는 문의 식별자 (큐 적재 시 중복 INSERT 방지 키)
+    reference = Column(String(36), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    __table_args__ = (
+        Index("uq_inquiries_reference", reference, unique=True),
+        # 관리자 목록 정렬(created_at desc, id desc) 키셋 페이지네이션용
+        Index("idx_inquiries_created_at", created_at.desc(), id.desc()),
+        Index("idx_inquiries_status_created_at", status, created_at.desc(), id.desc()),
+        Index("idx_inquiries_service_type_created_at", service_type, created_at.desc(), id.desc()),
+    )
 
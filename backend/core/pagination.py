@@ -0,0 +1,65 @@
+"""
+키셋(커서) 페이지네이션 유틸리티 모듈
+정렬 키 값 목록을 불투명한 base64url 문자열로 인코딩/디코딩합니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Sequence, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import String, func, literal
+from sqlalchemy.orm import Session
+
+from core.exceptions import ValidationException
+
+
+T = TypeVar("T")
+
+
+class CursorPage(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None  # 마지막 페이지면 None
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 값(마지막 행 기준)을 커서 문자열로 인코딩"""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """커서 문자열을 정렬 키 값 목록으로 디코딩 (형식이 잘못되면 ValidationException)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        raise ValidationException("Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValidationException("Invalid cursor")
+    return values
+
+
+def parse_cursor_datetime(value: Any) -> datetime:
+    """커서에 담긴 ISO 8601 문자열을 datetime으로 변환"""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValidationException("Invalid cursor")
+
+
+def cursor_datetime(db: Session, value: Any) -> Any:
+    """
+    커서의 created_at 값을 비교용 바인드 값으로 변환
+    
+    SQLite(로컬 개발)는 server_default로 저장된 'YYYY-MM-DD HH:MM:SS' 문자열과
+    문자열 비교를 하므로, 같은 형식으로 맞춰야 동일 시각의 행이 중복되지 않습니다.
+    created_at을 직접 지정해 저장한 행(문의 큐 등)은 마이크로초까지 저장되므로 그대로 유지합니다.
+    """
+    parsed = parse_cursor_datetime(value)
+    if db.get_bind().dialect.name == "sqlite":
+        if parsed.microsecond:
+            return literal(parsed.strftime("%Y-%m-%d %H:%M:%S.%f"), String)
+        return func.datetime(parsed.strftime("%Y-%m-%d %H:%M:%S"))
+    return parsed
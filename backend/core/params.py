@@ -0,0 +1,32 @@
+"""
+쿼리 파라미터 파싱 유틸리티 모듈
+"""
+from typing import Callable, List, TypeVar
+
+from core.config import settings
+from core.exceptions import ValidationException
+
+T = TypeVar("T")
+
+
+def parse_id_list(ids: str, cast: Callable[[str], T] = str) -> List[T]:
+    """
+    콤마로 구분된 ids 파라미터를 리스트로 변환 (중복 제거, 요청 순서 유지)
+    
+    Args:
+        ids: 예) "a,b,c" 또는 "1,2,3"
+        cast: 각 id 변환 함수 (예: int)
+    
+    Returns:
+        변환된 id 리스트 (최대 settings.BATCH_MAX_IDS개)
+    """
+    raw = [part.strip() for part in ids.split(",") if part.strip()]
+    if not raw:
+        raise ValidationException("ids must not be empty")
+    try:
+        parsed = list(dict.fromkeys(cast(part) for part in raw))
+    except ValueError:
+        raise ValidationException(f"Invalid ids: {ids}")
+    if len(parsed) > settings.BATCH_MAX_IDS:
+        raise ValidationException(f"Too many ids (max {settings.BATCH_MAX_IDS})")
+    return parsed
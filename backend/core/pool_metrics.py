@@ -0,0 +1,174 @@
+"""
+DB 커넥션 풀 지표 모듈
+SQLAlchemy 풀 이벤트와 대기 시간을 측정하는 QueuePool 서브클래스로
+체크아웃/대기/타임아웃/pre-ping 실패 횟수와 체크아웃 대기 시간 히스토그램을 수집합니다.
+Supabase 풀러 연결 수 제한에 맞춰 DB_POOL_SIZE / DB_MAX_OVERFLOW를 정할 때 사용합니다.
+"""
+import bisect
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# 체크아웃 대기 시간 히스토그램 버킷 상한(ms), 마지막 버킷은 +Inf
+WAIT_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+
+class PoolMetrics:
+    """엔진 하나의 커넥션 풀 지표 (스레드 안전)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool: Optional[Pool] = None
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.pre_ping_failures = 0
+        # 유휴 커넥션도, 새로 만들 overflow 여유도 없어 반환을 기다린 체크아웃 수
+        self.waits = 0
+        self.timeouts = 0
+        self._wait_counts = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self._wait_sum_ms = 0.0
+        self._wait_max_ms = 0.0
+
+    def _increment(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def observe_checkout(self, elapsed_ms: float, waited: bool, timed_out: bool) -> None:
+        with self._lock:
+            self._wait_counts[bisect.bisect_left(WAIT_BUCKETS_MS, elapsed_ms)] += 1
+            self._wait_sum_ms += elapsed_ms
+            self._wait_max_ms = max(self._wait_max_ms, elapsed_ms)
+            if waited:
+                self.waits += 1
+            if timed_out:
+                self.timeouts += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = list(self._wait_counts)
+            result: Dict[str, Any] = {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "pre_ping_failures": self.pre_ping_failures,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+            }
+            wait_sum, wait_max = self._wait_sum_ms, self._wait_max_ms
+
+        # 버킷 상한 이하 누적 개수 (Prometheus 히스토그램과 같은 le 형식)
+        histogram: Dict[str, int] = {}
+        cumulative = 0
+        for bound, count in zip([*map(str, WAIT_BUCKETS_MS), "+Inf"], counts):
+            cumulative += count
+            histogram[bound] = cumulative
+        result["checkout_wait_ms"] = {
+            "buckets": histogram,
+            "count": cumulative,
+            "sum": round(wait_sum, 3),
+            "max": round(wait_max, 3),
+        }
+
+        if isinstance(self.pool, QueuePool):
+            result.update(
+                size=self.pool.size(),
+                checked_out=self.pool.checkedout(),
+                checked_in=self.pool.checkedin(),
+                overflow=max(self.pool.overflow(), 0),
+                max_overflow=self.pool._max_overflow,
+            )
+        return result
+
+
+class _CheckoutTimingMixin:
+    """_do_get(풀에서 커넥션을 꺼내는 단계)의 소요 시간과 대기 여부를 기록"""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        metrics = self.metrics
+        if metrics is None:
+            return super()._do_get()
+
+        # max_overflow가 -1(무제한)이면 남는 커넥션이 없어도 새로 열기만 하고 기다리지 않음
+        waited = (
+            self._max_overflow > -1
+            and self.checkedin() == 0
+            and self.overflow() >= self._max_overflow
+        )
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            metrics.observe_checkout((time.perf_counter() - start) * 1000, waited, timed_out)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.metrics is not None:
+            self.metrics.pool = pool
+        return pool
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+# 엔진 이름("sync", "async") -> 지표
+pool_metrics: Dict[str, PoolMetrics] = {}
+
+
+def instrument_engine(engine: Any, name: str) -> PoolMetrics:
+    """
+    엔진의 풀 이벤트 리스너를 등록하고 지표 객체를 반환
+
+    Args:
+        engine: 동기 Engine (AsyncEngine은 .sync_engine을 전달)
+        name: /metrics에 표시할 이름
+    """
+    metrics = PoolMetrics(name)
+    metrics.pool = engine.pool
+    if isinstance(engine.pool, _CheckoutTimingMixin):
+        engine.pool.metrics = metrics
+
+    event.listen(engine, "checkout", lambda *args: metrics._increment("checkouts"))
+    event.listen(engine, "checkin", lambda *args: metrics._increment("checkins"))
+    event.listen(engine, "connect", lambda *args: metrics._increment("connects"))
+    event.listen(engine, "invalidate", lambda *args: metrics._increment("invalidations"))
+
+    @event.listens_for(engine, "handle_error")
+    def _count_pre_ping_failure(context):
+        if context.is_pre_ping:
+            metrics._increment("pre_ping_failures")
+
+    pool_metrics[name] = metrics
+    return metrics
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: metrics.stats() for name, metrics in pool_metrics.items()}
+
+
+def pool_class_for(url: str, async_engine: bool = False) -> Optional[type]:
+    """계측 풀 클래스 (SQLite처럼 QueuePool을 쓰지 않는 URL이면 None, 기본 풀 사용)"""
+    if url.startswith("sqlite"):
+        # 동기 파일 SQLite만 QueuePool (인메모리는 SingletonThreadPool, aiosqlite는 NullPool)
+        if async_engine or ":memory:" in url or url.rstrip("/").endswith(":"):
+            return None
+    return InstrumentedAsyncQueuePool if async_engine else InstrumentedQueuePool
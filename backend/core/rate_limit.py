@@ -0,0 +1,158 @@
+"""
+공개 쓰기 라우트 속도 제한 미들웨어 모듈
+(클라이언트 IP, 메서드, 경로) 단위 토큰 버킷으로 RATE_LIMIT_ROUTES에 등록한 라우트만 제한합니다.
+한 클라이언트가 문의 제출 등을 쏟아내도 DB 커넥션 풀(core.database)이 고갈되지 않아
+읽기 요청이 계속 처리됩니다. 제한을 넘으면 DB에 닿기 전에 429와 Retry-After를 반환합니다.
+관리자 키로 호출하는 서버 간 연동(결제/리뷰 이벤트 등)은 제한하지 않습니다.
+"""
+import json
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.config import settings
+from core.security import is_admin_key
+
+# /api/courses/12/reviews, /api/projects/<uuid> 처럼 id가 들어간 경로를 같은 라우트로 묶음
+_ID_SEGMENT_RE = re.compile(r"/(?:\d+|[0-9a-fA-F-]{32,36})(?=/|$)")
+
+
+def route_key(path: str) -> str:
+    return _ID_SEGMENT_RE.sub("/{id}", path.rstrip("/") or "/")
+
+
+class TokenBucketLimiter:
+    """
+    (클라이언트, 라우트)별 토큰 버킷 (스레드 안전)
+
+    - 라우트마다 (분당 요청 수, 최대 연속 허용 수)를 따로 설정하고, 설정이 없는 라우트는 제한하지 않습니다.
+    - 버킷은 [남은 토큰, 마지막 갱신 시각] 두 값만 저장합니다.
+    - max_buckets를 넘으면 가장 오래 사용되지 않은 버킷부터 제거합니다.
+      오래 쉰 버킷은 어차피 가득 찬 상태이므로 제거해도 결과가 같습니다.
+    """
+
+    def __init__(self, routes: Dict[str, Tuple[float, int]], max_buckets: int):
+        # 라우트 -> (초당 토큰, 최대 토큰)
+        self.routes = {
+            route: (rate_per_minute / 60.0, float(burst))
+            for route, (rate_per_minute, burst) in routes.items()
+        }
+        self.max_buckets = max_buckets
+        self._buckets: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.limited = 0
+        self.evicted = 0
+
+    def acquire(self, key: Tuple[str, str]) -> Tuple[bool, float, int]:
+        """
+        토큰 하나 사용 시도 (key: (클라이언트 IP, 라우트), 라우트는 routes에 있어야 함)
+
+        Returns:
+            (허용 여부, 다음 토큰까지 남은 초, 남은 토큰 수)
+        """
+        rate, burst = self.routes[key[1]]
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = [burst, now]
+                self._buckets[key] = bucket
+                while len(self._buckets) > self.max_buckets:
+                    self._buckets.popitem(last=False)
+                    self.evicted += 1
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                self.allowed += 1
+                return True, 0.0, int(bucket[0])
+            self.limited += 1
+            wait = (1.0 - bucket[0]) / rate if rate > 0 else float("inf")
+            return False, wait, 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "buckets": len(self._buckets),
+                "max_buckets": self.max_buckets,
+                "routes": {
+                    route: {"rate_per_minute": rate * 60.0, "burst": burst}
+                    for route, (rate, burst) in self.routes.items()
+                },
+                "allowed": self.allowed,
+                "limited": self.limited,
+                "evicted": self.evicted,
+            }
+
+
+def client_ip(scope: Scope) -> str:
+    """
+    요청한 클라이언트 IP
+
+    RATE_LIMIT_TRUSTED_PROXY_HOPS가 N이면 X-Forwarded-For의 오른쪽에서 N번째 값을 사용합니다.
+    신뢰하는 프록시가 덧붙인 값만 보므로 클라이언트가 헤더 왼쪽에 넣은 값으로 버킷을 바꿀 수 없습니다.
+    값이 N개보다 적으면 프록시를 거치지 않은 요청이므로 소켓 주소를 사용합니다.
+    """
+    hops = settings.RATE_LIMIT_TRUSTED_PROXY_HOPS
+    if hops > 0:
+        forwarded = ",".join(Headers(scope=scope).getlist("x-forwarded-for"))
+        addresses = [address.strip() for address in forwarded.split(",") if address.strip()]
+        if len(addresses) >= hops:
+            return addresses[-hops]
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class RateLimitMiddleware:
+    """
+    ASGI 라우트별 속도 제한 미들웨어
+
+    limiter.routes에 없는 라우트(읽기 요청 포함)와 관리자 키로 보낸 요청은 그대로 통과시킵니다.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: Optional[TokenBucketLimiter] = None) -> None:
+        self.app = app
+        self.limiter = limiter or rate_limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        route = f"{scope['method']} {route_key(scope['path'])}"
+        if route not in self.limiter.routes or is_admin_key(Headers(scope=scope).get("x-admin-key")):
+            await self.app(scope, receive, send)
+            return
+
+        allowed, wait, remaining = self.limiter.acquire((client_ip(scope), route))
+        if allowed:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = str(max(1, math.ceil(wait))) if math.isfinite(wait) else "60"
+        body = json.dumps({"detail": "Too many requests"}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", retry_after.encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+rate_limiter = TokenBucketLimiter(
+    routes=settings.RATE_LIMIT_ROUTES,
+    max_buckets=settings.RATE_LIMIT_MAX_BUCKETS
+)
@@ -0,0 +1,30 @@
+"""
+관리자 API 인증 유틸리티 모듈
+"""
+import hmac
+from typing import Optional
+
+from fastapi import Header
+
+from core.config import settings
+from core.exceptions import ForbiddenException
+
+
+def is_admin_key(x_admin_key: Optional[str]) -> bool:
+    """X-Admin-Key 값이 ADMIN_API_KEY와 일치하는지 상수 시간 비교 (키가 설정되지 않았으면 False)"""
+    if not settings.ADMIN_API_KEY or not x_admin_key:
+        return False
+    return hmac.compare_digest(x_admin_key.encode("utf-8"), settings.ADMIN_API_KEY.encode("utf-8"))
+
+
+def require_admin(x_admin_key: Optional[str] = Header(None, alias="X-Admin-Key")) -> None:
+    """
+    관리자 전용 라우트 의존성
+    
+    X-Admin-Key 헤더를 ADMIN_API_KEY와 상수 시간 비교하고, 키가 설정되지 않았으면
+    관리자 API를 비활성화(403)합니다.
+    """
+    if not settings.ADMIN_API_KEY:
+        raise ForbiddenException("Admin API is disabled")
+    if not is_admin_key(x_admin_key):
+        raise ForbiddenException("Invalid admin key")
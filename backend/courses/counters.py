@@ -0,0 +1,362 @@
+"""
+강의 카운터 write-behind 모듈
+수강 신청/리뷰 이벤트마다 courses 행을 갱신하면 인기 강의 행에 잠금 경합이 생기므로,
+프로세스 안에서 강의별 증가분(students, reviews, 평점 합)을 모아 두었다가
+주기적으로 한 번의 UPDATE ... CASE 문으로 반영합니다.
+
+크래시 안전성:
+- 이벤트는 메모리에 반영하기 전에 프로세스별 저널 파일에 한 줄씩 기록합니다.
+- flush는 저널을 flush-<pid>-<token>.pending으로 바꾼 뒤, 같은 트랜잭션에서
+  UPDATE와 course_counter_flushes(token) INSERT를 커밋하고 나서 파일을 지웁니다.
+- 재시작 시 남은 pending/저널 파일을 다시 반영하되, token이 이미 기록된 파일은
+  건너뛰므로 커밋 직후 크래시가 나도 두 번 더해지지 않습니다.
+"""
+import json
+import os
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy import case, func, update
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.database import SessionLocal
+from core.logger import logger
+from core.models import Course, CourseCounterFlush
+
+_JOURNAL_PREFIX = "journal-"
+_PENDING_PREFIX = "flush-"
+
+
+class CounterDelta:
+    """강의 하나의 아직 반영되지 않은 증가분"""
+
+    __slots__ = ("students", "reviews", "rating_sum")
+
+    def __init__(self, students: int = 0, reviews: int = 0, rating_sum: float = 0.0):
+        self.students = students
+        self.reviews = reviews
+        self.rating_sum = rating_sum
+
+    def add(self, other: "CounterDelta") -> None:
+        self.students += other.students
+        self.reviews += other.reviews
+        self.rating_sum += other.rating_sum
+
+    def apply(self, students: int, reviews: int, rating: float) -> Tuple[int, int, float]:
+        """저장된 값에 증가분을 더한 (students, reviews, rating) 반환 (rating은 리뷰 평균)"""
+        students = students or 0
+        reviews = reviews or 0
+        rating = rating or 0.0
+        total_reviews = reviews + self.reviews
+        if self.reviews and total_reviews > 0:
+            rating = (rating * reviews + self.rating_sum) / total_reviews
+        return students + self.students, total_reviews, rating
+
+
+Deltas = Dict[int, CounterDelta]
+
+
+def _read_journal(path: Path) -> Deltas:
+    """저널 파일을 강의별 증가분으로 합산 (크래시로 잘린 마지막 줄은 무시)"""
+    deltas: Deltas = {}
+    with open(path, encoding="utf-8") as fp:
+        for line in fp:
+            try:
+                course_id, students, reviews, rating_sum = json.loads(line)
+            except ValueError:
+                logger.warning(f"강의 카운터 저널의 손상된 줄을 건너뜁니다: {path}")
+                continue
+            deltas.setdefault(int(course_id), CounterDelta()).add(
+                CounterDelta(students, reviews, rating_sum)
+            )
+    return deltas
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        # 같은 pid의 파일은 이전 실행(컨테이너 재시작 등)이 남긴 것
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def apply_deltas(db: Session, token: str, deltas: Deltas) -> bool:
+    """
+    증가분을 한 번의 UPDATE로 반영하고 flush token을 같은 트랜잭션에 기록
+
+    Returns:
+        반영했으면 True, 이미 반영된 token이면 False
+    """
+    if db.get(CourseCounterFlush, token) is not None:
+        return False
+
+    ids = list(deltas)
+    if ids:
+        students = case({cid: d.students for cid, d in deltas.items()}, value=Course.id, else_=0)
+        reviews = case({cid: d.reviews for cid, d in deltas.items()}, value=Course.id, else_=0)
+        rating_sum = case({cid: d.rating_sum for cid, d in deltas.items()}, value=Course.id, else_=0.0)
+        current_students = func.coalesce(Course.students, 0)
+        current_reviews = func.coalesce(Course.reviews, 0)
+        current_rating = func.coalesce(Course.rating, 0.0)
+        # SET의 오른쪽은 모두 갱신 전 값을 참조하므로 rating 계산에 이전 reviews를 그대로 사용
+        db.execute(
+            update(Course)
+            .where(Course.id.in_(ids))
+            .values(
+                students=current_students + students,
+                reviews=current_reviews + reviews,
+                rating=case(
+                    (reviews > 0, (current_rating * current_reviews + rating_sum) / (current_reviews + reviews)),
+                    else_=current_rating
+                ),
+                updated_at=func.now()
+            )
+            .execution_options(synchronize_session=False)
+        )
+    db.add(CourseCounterFlush(id=token))
+    db.commit()
+    return True
+
+
+class CourseCounterAggregator:
+    """
+    강의 카운터 증가분 버퍼
+
+    - record(): 저널에 기록 후 메모리 버퍼에 더함
+    - pending(): 읽기 경로가 캐시된 응답에 더할 미반영 증가분
+    - flush(): 버퍼를 한 번의 UPDATE로 반영 (start()가 주기적으로 호출)
+    """
+
+    def __init__(self, journal_dir: Path, session_factory: Callable[[], Session]):
+        self.journal_dir = journal_dir
+        self.session_factory = session_factory
+        self.version = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._buffer: Deltas = {}
+        # token -> (pending 파일, 증가분): 저널에서 분리됐지만 아직 커밋되지 않은 묶음
+        self._unflushed: Dict[str, Tuple[Path, Deltas]] = {}
+        self._journal = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.flushes = 0
+        self.failures = 0
+
+    @property
+    def _journal_path(self) -> Path:
+        return self.journal_dir / f"{_JOURNAL_PREFIX}{os.getpid()}.log"
+
+    def _open_journal(self) -> None:
+        """저널 열기 (락 안에서 호출)"""
+        if self._journal is None:
+            self.journal_dir.mkdir(parents=True, exist_ok=True)
+            path = self._journal_path
+            if path.exists() and path.stat().st_size:
+                # 같은 pid의 이전 실행(컨테이너 재시작 등)이 남긴 저널을 recover() 전에 만난 경우:
+                # 이어 쓰면 _rotate()가 메모리 버퍼만 반영하고 파일을 지워 이전 줄이 유실되므로 먼저 분리
+                token = uuid.uuid4().hex
+                target = self.journal_dir / f"{_PENDING_PREFIX}{os.getpid()}-{token}.pending"
+                os.replace(path, target)
+                self._unflushed[token] = (target, _read_journal(target))
+                logger.info(f"이전 실행의 강의 카운터 저널을 복구했습니다: {path.name}")
+            self._journal = open(path, "a", encoding="utf-8")
+
+    def record(self, course_id: int, students: int = 0, reviews: int = 0, rating_sum: float = 0.0) -> None:
+        """증가분 기록 (저널에 쓴 뒤 반환하므로 반환 후 프로세스가 죽어도 유실되지 않음)"""
+        line = json.dumps([course_id, students, reviews, rating_sum]) + "\n"
+        with self._lock:
+            self._open_journal()
+            self._journal.write(line)
+            self._journal.flush()
+            if settings.COURSE_COUNTER_FSYNC:
+                os.fsync(self._journal.fileno())
+            self._buffer.setdefault(course_id, CounterDelta()).add(
+                CounterDelta(students, reviews, rating_sum)
+            )
+            self.version += 1
+
+    def has_pending(self) -> bool:
+        with self._lock:
+            return bool(self._buffer or self._unflushed)
+
+    def pending(self, course_id: int) -> Optional[CounterDelta]:
+        """아직 DB에 반영되지 않은 증가분 (버퍼 + 반영 중/실패한 묶음)"""
+        with self._lock:
+            total: Optional[CounterDelta] = None
+            sources = [self._buffer] + [deltas for _, deltas in self._unflushed.values()]
+            for deltas in sources:
+                delta = deltas.get(course_id)
+                if delta is not None:
+                    if total is None:
+                        total = CounterDelta()
+                    total.add(delta)
+            return total
+
+    def _rotate(self) -> None:
+        """현재 버퍼/저널을 token이 붙은 pending 묶음으로 분리 (락 안에서 호출)"""
+        if not self._buffer:
+            return
+        token = uuid.uuid4().hex
+        path = self.journal_dir / f"{_PENDING_PREFIX}{os.getpid()}-{token}.pending"
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._journal.close()
+        self._journal = None
+        os.replace(self._journal_path, path)
+        self._unflushed[token] = (path, self._buffer)
+        self._buffer = {}
+
+    def flush(self) -> int:
+        """
+        미반영 증가분을 DB에 반영
+
+        Returns:
+            반영한 강의 수 (DB 오류 시 묶음은 남겨 두고 다음 flush에서 다시 시도)
+        """
+        with self._flush_lock:
+            with self._lock:
+                self._rotate()
+                batches = list(self._unflushed.items())
+            if not batches:
+                return 0
+
+            flushed = 0
+            db = self.session_factory()
+            try:
+                for token, (path, deltas) in batches:
+                    try:
+                        applied = apply_deltas(db, token, deltas)
+                    except Exception as e:
+                        db.rollback()
+                        self.failures += 1
+                        logger.error(f"강의 카운터 반영 실패 (다음 주기에 재시도): {str(e)}")
+                        break
+                    path.unlink(missing_ok=True)
+                    with self._lock:
+                        self._unflushed.pop(token, None)
+                        self.version += 1
+                    if applied:
+                        flushed += len(deltas)
+            finally:
+                db.close()
+
+            if flushed:
+                self.flushes += 1
+                # 순환 import 방지를 위해 여기서 import
+                from courses.service import invalidate_course_cache
+                invalidate_course_cache()
+            return flushed
+
+    def recover(self) -> int:
+        """
+        종료된 프로세스(또는 이전 실행)가 남긴 저널/pending 파일을 가져와 반영 대상에 추가
+
+        Returns:
+            가져온 파일 수
+        """
+        if not self.journal_dir.exists():
+            return 0
+
+        claimed = 0
+        for path in sorted(self.journal_dir.iterdir()):
+            name = path.name
+            if name.startswith(_JOURNAL_PREFIX) and name.endswith(".log"):
+                pid_part, token = name[len(_JOURNAL_PREFIX):-len(".log")], uuid.uuid4().hex
+            elif name.startswith(_PENDING_PREFIX) and name.endswith(".pending"):
+                pid_part, _, token = name[len(_PENDING_PREFIX):-len(".pending")].partition("-")
+            else:
+                continue
+            if not pid_part.isdigit() or _pid_alive(int(pid_part)):
+                continue
+            if token in self._unflushed or (path == self._journal_path and self._journal is not None):
+                continue
+
+            # rename은 원자적이므로 여러 워커가 동시에 시작해도 한 워커만 가져감
+            target = self.journal_dir / f"{_PENDING_PREFIX}{os.getpid()}-{token}.pending"
+            try:
+                os.replace(path, target)
+            except FileNotFoundError:
+                continue
+            with self._lock:
+                self._unflushed[token] = (target, _read_journal(target))
+            claimed += 1
+
+        if claimed:
+            logger.info(f"강의 카운터 저널 {claimed}개를 복구했습니다.")
+        return claimed
+
+    def prune_tokens(self, older_than: timedelta = timedelta(days=7)) -> None:
+        """오래된 flush token 삭제 (그보다 오래 복구되지 않은 pending 파일은 없다고 가정)"""
+        db = self.session_factory()
+        try:
+            cutoff = datetime.now(timezone.utc) - older_than
+            db.query(CourseCounterFlush).filter(CourseCounterFlush.created_at < cutoff).delete(
+                synchronize_session=False
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"강의 카운터 flush token 정리 실패: {str(e)}")
+        finally:
+            db.close()
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"강의 카운터 flush 오류: {str(e)}")
+
+    def start(self, interval: Optional[float] = None) -> None:
+        """
+        남은 파일을 복구/반영하고 주기적 flush 스레드 시작
+
+        DB에 연결할 수 없어도 호출합니다. 복구한 증가분은 반영될 때까지 읽기 경로에 합쳐지고
+        flush 스레드가 DB가 돌아올 때까지 주기마다 다시 시도합니다.
+        """
+        if self._thread is not None:
+            return
+        self.recover()
+        self.flush()
+        self.prune_tokens()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(interval or settings.COURSE_COUNTER_FLUSH_INTERVAL_SECONDS,),
+            name="course-counter-flush",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """flush 스레드를 멈추고 남은 증가분을 마지막으로 반영"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        with self._lock:
+            if self._journal is not None and not self._buffer:
+                self._journal.close()
+                self._journal = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "buffered_courses": len(self._buffer),
+                "unflushed_batches": len(self._unflushed),
+                "flushes": self.flushes,
+                "failures": self.failures,
+            }
+
+
+course_counters = CourseCounterAggregator(Path(settings.COURSE_COUNTER_JOURNAL_DIR), SessionLocal)
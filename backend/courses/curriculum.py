@@ -0,0 +1,73 @@
+"""
+강의 커리큘럼 통계 모듈
+curriculum JSON(ChapterSchema/LessonSchema 형태)에서 레슨 수, 무료 레슨 수, 총 재생 시간을 계산합니다.
+강의 쓰기 시점에 한 번 계산해 courses 테이블에 저장합니다.
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+# 시간 없이 분만 쓰는 경우 "120:00"처럼 분이 두 자리를 넘을 수 있음
+_CLOCK_RE = re.compile(r"^\s*(?:(\d+):)?(\d+):(\d{1,2})\s*$")
+_UNIT_RE = re.compile(r"(\d+)\s*(시간|분|초|h|m|s)", re.IGNORECASE)
+_UNIT_SECONDS = {"시간": 3600, "h": 3600, "분": 60, "m": 60, "초": 1, "s": 1}
+_TRUE_STRINGS = {"true", "1", "yes", "y", "on"}
+
+
+def parse_duration(duration: Any) -> Optional[int]:
+    """
+    레슨 재생 시간을 초 단위로 변환
+
+    지원 형식: "12:34", "120:00"(mm:ss), "1:02:03"(hh:mm:ss), "1시간 20분", "30초", "1h 5m"
+    해석할 수 없으면 None
+    """
+    if not isinstance(duration, str):
+        return None
+
+    match = _CLOCK_RE.match(duration)
+    if match:
+        hours, minutes, seconds = match.groups()
+        return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
+
+    units = _UNIT_RE.findall(duration)
+    if units:
+        return sum(int(value) * _UNIT_SECONDS[unit.lower()] for value, unit in units)
+    return None
+
+
+def parse_bool(value: Any) -> bool:
+    """JSON에 문자열로 저장된 불리언("false", "0" 등)도 올바르게 해석"""
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUE_STRINGS
+    if isinstance(value, (bool, int, float)):
+        return bool(value)
+    return False
+
+
+def compute_curriculum_stats(curriculum: Optional[List[Dict[str, Any]]]) -> Dict[str, int]:
+    """
+    curriculum에서 courses 테이블의 통계 컬럼 값을 계산
+
+    Returns:
+        {"lesson_count": ..., "free_lesson_count": ..., "total_duration_seconds": ...}
+    """
+    lesson_count = 0
+    free_lesson_count = 0
+    total_seconds = 0
+
+    for chapter in curriculum or []:
+        if not isinstance(chapter, dict):
+            continue
+        for lesson in chapter.get("lessons") or []:
+            if not isinstance(lesson, dict):
+                continue
+            lesson_count += 1
+            # 저장 형태(is_free)와 응답 형태(isFree) 모두 허용
+            if parse_bool(lesson.get("is_free", lesson.get("isFree", False))):
+                free_lesson_count += 1
+            total_seconds += parse_duration(lesson.get("duration")) or 0
+
+    return {
+        "lesson_count": lesson_count,
+        "free_lesson_count": free_lesson_count,
+        "total_duration_seconds": total_seconds,
+    }
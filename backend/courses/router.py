@@ -1,22 +1,123 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from typing import List
-from core.database import get_db
-from courses.service import get_courses, get_course_by_id
-from courses.schemas import CourseListResponse, CourseDetailResponse
+from fastapi import APIRouter, Depends, Query, Request, Response
+from typing import List, Optional
+from core.database import DBRunner, get_db_runner
+from core.etag import etag_matches, make_etag, not_modified, set_etag
+from core.fieldsets import json_response, parse_fields, partial_model
+from core.params import parse_id_list
+from core.security import require_admin
+from courses.service import (
+    get_courses_snapshot,
+    get_courses_fields,
+    get_courses_by_ids,
+    get_course_snapshot,
+    get_course_fields_by_id,
+    create_course,
+    record_enrollment,
+    record_review,
+    get_courses_etag,
+    get_course_etag,
+)
+from courses.schemas import (
+    CourseListResponse,
+    CourseDetailResponse,
+    CourseBatchResponse,
+    CourseCreate,
+    CourseReviewCreate,
+    CourseEventResponse,
+)
 
 router = APIRouter(prefix="/courses", tags=["courses"])
 
 
 @router.get("", response_model=List[CourseListResponse])
-def list_courses(db: Session = Depends(get_db)) -> List[CourseListResponse]:
-    return get_courses(db)
+async def list_courses(
+    request: Request,
+    fields: Optional[str] = Query(None, description="Comma-separated CourseListResponse fields to return"),
+    run: DBRunner = Depends(get_db_runner)
+) -> List[CourseListResponse]:
+    selected = parse_fields(fields, CourseListResponse)
+    etag = await run(get_courses_etag)
+    if selected:
+        etag = make_etag(etag, selected)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    if selected:
+        result = json_response(
+            await run(get_courses_fields, selected),
+            List[partial_model(CourseListResponse, selected)]
+        )
+        set_etag(result, etag)
+        return result
+    snapshot = Response(content=await run(get_courses_snapshot), media_type="application/json")
+    set_etag(snapshot, etag)
+    return snapshot
+
+
+@router.get("/batch", response_model=CourseBatchResponse)
+async def get_courses_batch(
+    ids: str = Query(..., description="Comma-separated course ids"),
+    run: DBRunner = Depends(get_db_runner)
+) -> CourseBatchResponse:
+    return await run(get_courses_by_ids, parse_id_list(ids, int))
 
 
 @router.get("/{course_id}", response_model=CourseDetailResponse)
-def get_course(
+async def get_course(
     course_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    fields: Optional[str] = Query(None, description="Comma-separated CourseDetailResponse fields to return"),
+    run: DBRunner = Depends(get_db_runner)
+) -> CourseDetailResponse:
+    selected = parse_fields(fields, CourseDetailResponse)
+    etag = await run(get_course_etag, course_id)
+    if selected:
+        etag = make_etag(etag, selected)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    if selected:
+        course = await run(get_course_fields_by_id, course_id, selected)
+        result = json_response(course, type(course))
+        set_etag(result, etag)
+        return result
+    snapshot = Response(content=await run(get_course_snapshot, course_id), media_type="application/json")
+    set_etag(snapshot, etag)
+    return snapshot
+
+
+@router.post("", response_model=CourseDetailResponse, status_code=201, dependencies=[Depends(require_admin)])
+async def create_new_course(
+    course_data: CourseCreate,
+    run: DBRunner = Depends(get_db_runner)
 ) -> CourseDetailResponse:
-    return get_course_by_id(db, course_id)
+    return await run(create_course, course_data)
 
+
+# 수강생/리뷰 카운터는 모아서 주기적으로 반영하므로 202 (courses.counters)
+# 결제/리뷰 처리 등 서버 측 연동만 호출할 수 있도록 관리자 키 필요 (공개 API로 카운터를 조작하지 못하게)
+@router.post(
+    "/{course_id}/enrollments",
+    response_model=CourseEventResponse,
+    status_code=202,
+    dependencies=[Depends(require_admin)]
+)
+async def enroll_course(
+    course_id: int,
+    run: DBRunner = Depends(get_db_runner)
+) -> CourseEventResponse:
+    await run(record_enrollment, course_id)
+    return CourseEventResponse()
+
+
+@router.post(
+    "/{course_id}/reviews",
+    response_model=CourseEventResponse,
+    status_code=202,
+    dependencies=[Depends(require_admin)]
+)
+async def review_course(
+    course_id: int,
+    review: CourseReviewCreate,
+    run: DBRunner = Depends(get_db_runner)
+) -> CourseEventResponse:
+    await run(record_review, course_id, review.rating)
+    return CourseEventResponse()
@@ -53,8 +53,12 @@ class CourseListResponse(BaseModel):
     pages: Optional[int] = None
     chapters: Optional[int] = None
     rating: float
+    reviews: int = 0
     students: int
     level: str
+    lesson_count: int = 0
+    free_lesson_count: int = 0
+    total_duration_seconds: int = 0
     isPurchased: bool = False
     
     class Config:
@@ -68,6 +72,9 @@ class CourseDetailResponse(CourseBase):
     whatYouLearn: List[str] = Field(alias="what_you_learn")
     curriculum: List[Dict[str, Any]]
     requirements: List[str]
+    lesson_count: int = 0
+    free_lesson_count: int = 0
+    total_duration_seconds: int = 0
     created_at: datetime
     updated_at: Optional[datetime] = None
     
@@ -75,3 +82,16 @@ class CourseDetailResponse(CourseBase):
         from_attributes = True
         populate_by_name = True
 
+
+
+class CourseBatchResponse(BaseModel):
+    items: List[CourseDetailResponse]  # 요청한 id 순서
+    missing: List[int] = []  # 존재하지 않는 id
+
+
+class CourseReviewCreate(BaseModel):
+    rating: float = Field(..., ge=1, le=5)
+
+
+class CourseEventResponse(BaseModel):
+    message: str = "Accepted"
@@ -1,31 +1,423 @@
-from sqlalchemy.orm import Session
-from typing import List
+from pydantic import TypeAdapter
+from sqlalchemy import func
+from sqlalchemy.orm import Session, load_only
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from core.cache import TTLCache
+from core.config import settings
+from core.etag import make_etag
+from core.fieldsets import partial_model
 from core.exceptions import NotFoundException
+from core.logger import logger
 from core.models import Course
-from courses.schemas import CourseListResponse, CourseDetailResponse
+from courses.counters import course_counters
+from courses.curriculum import compute_curriculum_stats
+from courses.schemas import CourseListResponse, CourseDetailResponse, CourseBatchResponse, CourseCreate
+
+
+# ("list",) -> List[CourseListResponse]
+# ("snapshot",) -> 인코딩된 목록 JSON 바이트
+# ("fields", fields) -> (부분 응답 모델 리스트, 강의별 (id, 저장된 reviews) 리스트)
+# ("detail", course_id) -> CourseDetailResponse
+# ("snapshot:detail", course_id) -> 인코딩된 상세 JSON 바이트
+# ("fields:detail", course_id, fields) -> (부분 응답 모델, 저장된 reviews)
+# ("snapshot:pending",) / ("snapshot:pending:detail", course_id)
+#     -> (카운터 버전, 미반영 증가분을 더한 JSON 바이트)
+_course_cache = TTLCache(
+    maxsize=settings.COURSE_CACHE_MAXSIZE,
+    ttl=settings.COURSE_CACHE_TTL_SECONDS
+)
+
+# ("list",) / ("detail", course_id) -> 캐시된 응답을 만들 때 DB에서 계산한 ETag
+# 만료되지 않고 캐시를 비울 때만 함께 비우므로, 캐시에 응답이 있는 동안에는 항상 기준 ETag가 있음
+# (개수가 _MAX_TRACKED_ETAGS를 넘으면 기준을 잃은 응답이 남지 않도록 캐시와 함께 비움)
+_cached_etags: Dict[Tuple[Any, ...], str] = {}
+_MAX_TRACKED_ETAGS = settings.COURSE_CACHE_MAXSIZE
+
+_course_list_adapter = TypeAdapter(List[CourseListResponse])
+
+
+# 목록에는 curriculum, what_you_learn 등 JSON 컬럼이 필요 없으므로 제외
+_LIST_COLUMNS = [
+    getattr(Course, name) for name in CourseListResponse.model_fields
+    if hasattr(Course, name)
+]
+
+
+# 응답 필드명 -> 조회할 컬럼 (이름이 다른 필드만; isPurchased처럼 컬럼이 없는 필드는 빈 목록)
+_FIELD_COLUMNS = {
+    "instructor": [Course.instructor_name, Course.instructor_bio],
+    "whatYouLearn": [Course.what_you_learn],
+    "isPurchased": [],
+}
+
+
+def _columns_for(fields: Tuple[str, ...]) -> List[Any]:
+    columns: List[Any] = []
+    for name in fields:
+        if name in _FIELD_COLUMNS:
+            columns.extend(_FIELD_COLUMNS[name])
+        else:
+            columns.append(getattr(Course, name))
+    # 미반영 리뷰를 rating 평균에 합치려면 요청하지 않았어도 저장된 리뷰 수가 필요 (_with_pending)
+    if "rating" in fields and "reviews" not in fields:
+        columns.append(Course.reviews)
+    return columns or [Course.id]
+
+
+def invalidate_course_cache() -> None:
+    """강의 쓰기 후 읽기 캐시를 비움"""
+    _course_cache.clear()
+    _cached_etags.clear()
+
+
+def _track_etags(etags: Dict[Tuple[Any, ...], str]) -> None:
+    """
+    DB에서 계산한 ETag가 캐시된 응답의 기준 ETag와 다르면 캐시를 비움
+    
+    스크립트나 Supabase 대시보드처럼 이 프로세스를 거치지 않은 쓰기도
+    다음 요청에서 바로 반영되어, 오래된 본문이나 304를 돌려주지 않습니다.
+    여러 개를 한 번에 확인한 뒤 기록하므로 도중에 캐시를 비워 앞서 기록한 기준을 잃지 않습니다.
+    """
+    if any(_cached_etags.get(key, etag) != etag for key, etag in etags.items()):
+        logger.info("강의가 외부에서 변경되어 강의 캐시를 비웁니다.")
+        invalidate_course_cache()
+    elif len(_cached_etags) + sum(key not in _cached_etags for key in etags) > _MAX_TRACKED_ETAGS:
+        invalidate_course_cache()
+    _cached_etags.update(etags)
+
+
+def _track_etag(key: Tuple[Any, ...], etag: str) -> None:
+    _track_etags({key: etag})
+
+
+def _course_etag(row: Any) -> str:
+    """강의 상세의 기준 ETag (id, created_at, updated_at을 조회한 행)"""
+    return make_etag("course", row.id, row.created_at, row.updated_at)
+
+
+_COUNTER_FIELDS = ("students", "reviews", "rating")
+
+
+def _with_pending(course: Any, course_id: Optional[int] = None, stored_reviews: Optional[int] = None) -> Any:
+    """
+    캐시된 응답 모델에 아직 반영되지 않은 카운터 증가분(courses.counters)을 더한 복사본
+
+    증가분이 없거나 카운터 필드가 없는 부분 응답이면 그대로 반환합니다.
+    rating 평균은 저장된 리뷰 수로 다시 계산하므로, reviews 없이 rating만 요청한
+    부분 응답은 stored_reviews를 함께 넘겨야 전체 응답과 같은 값이 됩니다.
+    """
+    fields = type(course).model_fields
+    if not any(name in fields for name in _COUNTER_FIELDS):
+        return course
+    if course_id is None:
+        course_id = getattr(course, "id", None)
+    delta = course_counters.pending(course_id) if course_id is not None else None
+    if delta is None:
+        return course
+
+    students, reviews, rating = delta.apply(
+        getattr(course, "students", 0),
+        getattr(course, "reviews", stored_reviews),
+        getattr(course, "rating", 0.0)
+    )
+    update = {
+        name: value
+        for name, value in zip(_COUNTER_FIELDS, (students, reviews, rating))
+        if name in fields
+    }
+    return course.model_copy(update=update)
+
+
+def _loaded_reviews(course: Course) -> int:
+    """load_only로 조회한 행의 저장된 리뷰 수 (조회하지 않았으면 지연 로딩 없이 0)"""
+    return course.__dict__.get("reviews") or 0
+
+
+def _pending_snapshot(key: Tuple[Any, ...], build: Callable[[], bytes]) -> bytes:
+    """증가분을 더한 스냅샷 (카운터 버전이 같으면 재사용)"""
+    version = course_counters.version
+    cached = _course_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    generation = _course_cache.generation
+    content = build()
+    _course_cache.set(key, (version, content), generation)
+    return content
+
+
+def _course_to_detail_dict(course: Course) -> Dict[str, Any]:
+    """로드된 컬럼만으로 CourseDetailResponse 입력 dict 구성"""
+    course_dict = {k: v for k, v in course.__dict__.items() if not k.startswith("_")}
+    if "instructor_name" in course_dict or "instructor_bio" in course_dict:
+        course_dict["instructor"] = {
+            "name": course_dict.get("instructor_name"),
+            "bio": course_dict.get("instructor_bio")
+        }
+    if "what_you_learn" in course_dict:
+        course_dict["what_you_learn"] = course_dict["whatYouLearn"] = course_dict["what_you_learn"] or []
+    for key in ("curriculum", "requirements"):
+        if key in course_dict:
+            course_dict[key] = course_dict[key] or []
+    return course_dict
 
 
 def get_courses(db: Session) -> List[CourseListResponse]:
-    courses = db.query(Course).order_by(Course.created_at.desc()).all()
-    return [CourseListResponse.model_validate(course) for course in courses]
+    """강의 목록 (목록 컬럼만 조회, 검증된 응답 모델을 캐시)"""
+    def load() -> List[CourseListResponse]:
+        courses = (
+            db.query(Course)
+            .options(load_only(*_LIST_COLUMNS))
+            .order_by(Course.created_at.desc())
+            .all()
+        )
+        return [CourseListResponse.model_validate(course) for course in courses]
+    
+    courses = _course_cache.get_or_set(("list",), load)
+    if course_counters.has_pending():
+        return [_with_pending(course) for course in courses]
+    return courses
+
+
+def get_courses_snapshot(db: Session) -> bytes:
+    """강의 목록을 JSON 바이트로 미리 인코딩해 캐시 (라우터가 그대로 반환)"""
+    def build() -> bytes:
+        return _course_list_adapter.dump_json(get_courses(db), by_alias=True)
+    
+    if course_counters.has_pending():
+        return _pending_snapshot(("snapshot:pending",), build)
+    return _course_cache.get_or_set(("snapshot",), build)
+
+
+def get_courses_fields(db: Session, fields: Tuple[str, ...]) -> List[Any]:
+    """요청한 필드만 조회/직렬화하는 강의 목록 (?fields=)"""
+    def load() -> Tuple[List[Any], List[Tuple[int, int]]]:
+        model = partial_model(CourseListResponse, fields)
+        courses = (
+            db.query(Course)
+            .options(load_only(*_columns_for(fields)))
+            .order_by(Course.created_at.desc())
+            .all()
+        )
+        # id/reviews를 요청하지 않은 응답에도 미반영 증가분을 합칠 수 있도록 함께 보관
+        return (
+            [model.model_validate(course) for course in courses],
+            [(course.id, _loaded_reviews(course)) for course in courses]
+        )
+    
+    courses, counters = _course_cache.get_or_set(("fields", fields), load)
+    if course_counters.has_pending():
+        return [
+            _with_pending(course, course_id, stored_reviews)
+            for course, (course_id, stored_reviews) in zip(courses, counters)
+        ]
+    return courses
+
+
+def get_courses_etag(db: Session) -> str:
+    """
+    강의 목록의 ETag 계산 (행 개수와 타임스탬프 최댓값만 집계)
+    
+    외부 쓰기를 감지할 수 있도록 요청마다 DB에서 계산합니다. (강의 테이블은 작아 집계 비용이 작음)
+    """
+    count, last_created, last_updated = db.query(
+        func.count(Course.id),
+        func.max(Course.created_at),
+        func.max(Course.updated_at)
+    ).one()
+    etag = make_etag("courses", count, last_created, last_updated)
+    _track_etag(("list",), etag)
+    if course_counters.has_pending():
+        return make_etag(etag, "pending", course_counters.version)
+    return etag
+
+
+def get_course_etag(db: Session, course_id: int) -> str:
+    """강의 상세의 ETag 계산 (요청마다 기본 키로 조회, 존재하지 않으면 NotFoundException)"""
+    row = (
+        db.query(Course.id, Course.created_at, Course.updated_at)
+        .filter(Course.id == course_id)
+        .first()
+    )
+    if not row:
+        raise NotFoundException("Course", str(course_id))
+    etag = _course_etag(row)
+    _track_etag(("detail", course_id), etag)
+    if course_counters.pending(course_id) is not None:
+        return make_etag(etag, "pending", course_counters.version)
+    return etag
 
 
 def get_course_by_id(db: Session, course_id: int) -> CourseDetailResponse:
-    course = db.query(Course).filter(Course.id == course_id).first()
+    """강의 상세 (instructor/whatYouLearn 재구성과 검증 결과를 캐시)"""
+    def load() -> CourseDetailResponse:
+        course = db.query(Course).filter(Course.id == course_id).first()
+        
+        if not course:
+            raise NotFoundException("Course", str(course_id))
+        
+        return CourseDetailResponse.model_validate(_course_to_detail_dict(course))
+    
+    return _with_pending(_course_cache.get_or_set(("detail", course_id), load), course_id)
+
+
+def get_course_snapshot(db: Session, course_id: int) -> bytes:
+    """강의 상세를 JSON 바이트로 미리 인코딩해 캐시 (라우터가 그대로 반환)"""
+    def build() -> bytes:
+        return get_course_by_id(db, course_id).model_dump_json(by_alias=True).encode("utf-8")
+    
+    if course_counters.pending(course_id) is not None:
+        return _pending_snapshot(("snapshot:pending:detail", course_id), build)
+    return _course_cache.get_or_set(("snapshot:detail", course_id), build)
+
+
+def get_courses_by_ids(db: Session, course_ids: List[int]) -> CourseBatchResponse:
+    """
+    여러 강의 조회 (요청 순서 유지, 없는 id는 missing)
+    
+    상세 ETag와 같은 기준(id, created_at, updated_at)을 먼저 조회해 외부 쓰기를 감지한 뒤,
+    캐시에 있는 상세는 재사용하고 나머지만 한 번의 WHERE id IN (...) 쿼리로 조회합니다.
+    """
+    rows = (
+        db.query(Course.id, Course.created_at, Course.updated_at)
+        .filter(Course.id.in_(course_ids))
+        .all()
+    )
+    _track_etags({("detail", row.id): _course_etag(row) for row in rows})
+    
+    generation = _course_cache.generation
+    by_id: Dict[int, CourseDetailResponse] = {}
+    for row in rows:
+        cached = _course_cache.get(("detail", row.id))
+        if cached is not None:
+            by_id[row.id] = cached
+    
+    misses = [row.id for row in rows if row.id not in by_id]
+    if misses:
+        for course in db.query(Course).filter(Course.id.in_(misses)).all():
+            detail = CourseDetailResponse.model_validate(_course_to_detail_dict(course))
+            _course_cache.set(("detail", course.id), detail, generation)
+            by_id[course.id] = detail
+    
+    return CourseBatchResponse(
+        items=[_with_pending(by_id[course_id]) for course_id in course_ids if course_id in by_id],
+        missing=[course_id for course_id in course_ids if course_id not in by_id]
+    )
+
+
+def get_course_fields_by_id(db: Session, course_id: int, fields: Tuple[str, ...]) -> Any:
+    """요청한 필드만 조회/직렬화하는 강의 상세 (?fields=)"""
+    def load() -> Tuple[Any, int]:
+        course = (
+            db.query(Course)
+            .options(load_only(*_columns_for(fields)))
+            .filter(Course.id == course_id)
+            .first()
+        )
+        
+        if not course:
+            raise NotFoundException("Course", str(course_id))
+        
+        model = partial_model(CourseDetailResponse, fields).model_validate(_course_to_detail_dict(course))
+        return model, _loaded_reviews(course)
+    
+    course, stored_reviews = _course_cache.get_or_set(("fields:detail", course_id, fields), load)
+    return _with_pending(course, course_id, stored_reviews)
+
+
+def create_course(db: Session, course_data: CourseCreate) -> CourseDetailResponse:
+    """
+    새 강의 생성
+    
+    Args:
+        db: 데이터베이스 세션
+        course_data: 강의 생성 데이터
+    
+    Returns:
+        생성된 강의 정보
+    """
+    # 레슨 수/무료 레슨 수/총 재생 시간은 여기서 한 번 계산해 저장
+    course = Course(
+        **course_data.model_dump(),
+        **compute_curriculum_stats(course_data.curriculum)
+    )
+    
+    db.add(course)
+    db.commit()
+    db.refresh(course)
+    invalidate_course_cache()
     
-    if not course:
+    logger.info(f"새 강의 '{course.title}' (ID: {course.id})를 생성했습니다.")
+    
+    return CourseDetailResponse.model_validate(_course_to_detail_dict(course))
+
+
+def _ensure_course_exists(db: Session, course_id: int) -> None:
+    """강의가 없으면 NotFoundException (ETag 기준은 건드리지 않음)"""
+    if db.query(Course.id).filter(Course.id == course_id).first() is None:
         raise NotFoundException("Course", str(course_id))
+
+
+def record_enrollment(db: Session, course_id: int) -> None:
+    """
+    수강 신청 이벤트 기록 (students +1, 주기적으로 일괄 반영)
     
-    course_dict = {
-        **{k: v for k, v in course.__dict__.items() if not k.startswith("_")},
-        "instructor": {
-            "name": course.instructor_name,
-            "bio": course.instructor_bio
-        },
-        "whatYouLearn": course.what_you_learn or [],
-        "curriculum": course.curriculum or [],
-        "requirements": course.requirements or []
-    }
+    Args:
+        db: 데이터베이스 세션 (강의 존재 확인용)
+        course_id: 강의 ID
+    """
+    _ensure_course_exists(db, course_id)
+    course_counters.record(course_id, students=1)
+
+
+def record_review(db: Session, course_id: int, rating: float) -> None:
+    """
+    리뷰 이벤트 기록 (reviews +1, rating은 반영 시 평균으로 다시 계산)
     
-    return CourseDetailResponse.model_validate(course_dict)
+    Args:
+        db: 데이터베이스 세션 (강의 존재 확인용)
+        course_id: 강의 ID
+        rating: 리뷰 평점 (1~5)
+    """
+    _ensure_course_exists(db, course_id)
+    course_counters.record(course_id, reviews=1, rating_sum=rating)
 
+
+def backfill_curriculum_stats(db: Session, dry_run: bool = False) -> int:
+    """
+    저장된 모든 강의의 커리큘럼 통계를 다시 계산 (값이 달라진 강의만 갱신)
+    
+    Args:
+        db: 데이터베이스 세션
+        dry_run: True면 변경 대상 개수만 계산하고 커밋하지 않음
+    
+    Returns:
+        통계가 변경된(또는 변경될) 강의 수
+    """
+    courses = db.query(Course).options(
+        load_only(
+            Course.id,
+            Course.curriculum,
+            Course.lesson_count,
+            Course.free_lesson_count,
+            Course.total_duration_seconds
+        )
+    ).all()
+    
+    changed = 0
+    for course in courses:
+        stats = compute_curriculum_stats(course.curriculum)
+        if all(getattr(course, name) == value for name, value in stats.items()):
+            continue
+        changed += 1
+        if not dry_run:
+            for name, value in stats.items():
+                setattr(course, name, value)
+    
+    if dry_run:
+        db.rollback()
+    elif changed:
+        db.commit()
+        invalidate_course_cache()
+    
+    logger.info(f"커리큘럼 통계 백필: {changed}개 강의 {'(dry-run)' if dry_run else '갱신'}")
+    return changed
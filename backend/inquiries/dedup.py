@@ -0,0 +1,235 @@
+"""
+문의 중복 제출 방지 모듈
+Idempotency-Key 헤더와 요청 내용 해시로 같은 문의의 반복 제출을 감지하고,
+처음 요청의 InquiryCreateResponse와 상태 코드를 DB를 거치지 않고 그대로 돌려줍니다.
+
+- 처리 중인 키는 "pending"으로 선점하므로 동시에 들어온 더블 클릭도 한 번만 저장합니다.
+  나중 요청은 INQUIRY_DEDUP_WAIT_SECONDS 동안 첫 요청의 결과를 기다립니다.
+- 저장소는 프로세스별 메모리(TTL + LRU) 또는 여러 워커가 공유하는 SQLite 파일입니다.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.cache import TTLCache
+from core.config import settings
+from core.exceptions import ConflictException, ValidationException
+from core.logger import logger
+from inquiries.schemas import InquiryCreate, InquiryCreateResponse
+
+# 첫 요청이 응답 없이 죽은 경우 선점이 풀리기까지의 시간(초)
+_PENDING_TTL_SECONDS = 60.0
+_POLL_SECONDS = 0.05
+_MAX_KEY_LENGTH = 255
+
+
+class MemoryDedupStore:
+    """프로세스별 메모리 저장소 (TTL 만료 + 크기 제한 LRU)"""
+
+    def __init__(self, maxsize: int):
+        self._cache = TTLCache(maxsize=maxsize, ttl=_PENDING_TTL_SECONDS)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    def add(self, key: str, value: str, ttl: float) -> bool:
+        return self._cache.add(key, value, ttl=ttl)
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        self._cache.set(key, value, ttl=ttl)
+
+    def delete(self, key: str) -> None:
+        self._cache.pop(key)
+
+
+class SQLiteDedupStore:
+    """여러 워커 프로세스가 공유하는 SQLite 파일 저장소"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS inquiry_dedup ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT value FROM inquiry_dedup WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def add(self, key: str, value: str, ttl: float) -> bool:
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            # 만료된 항목만 덮어쓰므로 확인과 저장이 한 문장에서 원자적으로 처리됨
+            cursor = conn.execute(
+                "INSERT INTO inquiry_dedup (key, value, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at "
+                "WHERE inquiry_dedup.expires_at <= ?",
+                (key, value, now + ttl, now)
+            )
+            conn.commit()
+            self._maybe_purge(conn, now)
+            return cursor.rowcount > 0
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO inquiry_dedup (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl)
+            )
+            conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM inquiry_dedup WHERE key = ?", (key,))
+            conn.commit()
+
+    def _maybe_purge(self, conn: sqlite3.Connection, now: float) -> None:
+        """쓰기 1000번마다 만료된 항목 삭제 (락 안에서 호출)"""
+        self._writes += 1
+        if self._writes % 1000 == 0:
+            conn.execute("DELETE FROM inquiry_dedup WHERE expires_at <= ?", (now,))
+            conn.commit()
+
+
+class DedupClaim:
+    """이번 요청이 선점한 키 목록 ((키, 완료 후 보관 시간) 목록과 요청 해시)"""
+
+    def __init__(self, request_hash: str):
+        self.request_hash = request_hash
+        self.keys: List[Tuple[str, float]] = []
+        self.replay: Optional[Tuple[InquiryCreateResponse, int]] = None
+
+
+def request_hash(inquiry_data: InquiryCreate) -> str:
+    """문의 내용의 정규화된 해시 (이메일은 대소문자 무시)"""
+    payload = inquiry_data.model_dump()
+    payload["email"] = payload["email"].lower()
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class InquiryDeduplicator:
+    """Idempotency-Key / 내용 해시 기반 문의 중복 제출 방지"""
+
+    def __init__(self, store: Any):
+        self.store = store
+        self.replayed = 0
+        self.conflicts = 0
+
+    def _keys(self, idempotency_key: Optional[str], hashed: str) -> List[Tuple[str, float]]:
+        keys: List[Tuple[str, float]] = []
+        if idempotency_key is not None:
+            idempotency_key = idempotency_key.strip()
+            if not idempotency_key or len(idempotency_key) > _MAX_KEY_LENGTH:
+                raise ValidationException(f"Idempotency-Key must be 1-{_MAX_KEY_LENGTH} characters")
+            keys.append((f"key:{idempotency_key}", settings.IDEMPOTENCY_KEY_TTL_SECONDS))
+        if settings.INQUIRY_DEDUP_WINDOW_SECONDS > 0:
+            keys.append((f"content:{hashed}", settings.INQUIRY_DEDUP_WINDOW_SECONDS))
+        return keys
+
+    def _wait(self, key: str, hashed: str) -> Optional[Dict[str, Any]]:
+        """키를 선점하거나 완료된 결과를 반환 (None이면 선점 성공)"""
+        pending = json.dumps({"state": "pending", "hash": hashed})
+        deadline = time.monotonic() + settings.INQUIRY_DEDUP_WAIT_SECONDS
+        while True:
+            if self.store.add(key, pending, _PENDING_TTL_SECONDS):
+                return None
+            raw = self.store.get(key)
+            if raw is not None:
+                entry = json.loads(raw)
+                if key.startswith("key:") and entry["hash"] != hashed:
+                    raise ValidationException("Idempotency-Key was already used with a different request body")
+                if entry["state"] == "done":
+                    return entry
+            if time.monotonic() >= deadline:
+                self.conflicts += 1
+                raise ConflictException("An identical inquiry is already being processed")
+            time.sleep(_POLL_SECONDS)
+
+    def claim(self, idempotency_key: Optional[str], inquiry_data: InquiryCreate) -> DedupClaim:
+        """
+        중복 여부 확인 후 키 선점 (블로킹, 스레드풀에서 호출)
+
+        Args:
+            idempotency_key: Idempotency-Key 헤더 값 (없으면 None)
+            inquiry_data: 검증된 문의 데이터
+
+        Returns:
+            replay가 있으면 이전 응답을 돌려주고, 없으면 complete()/release()로 마무리해야 하는 선점 정보
+        """
+        hashed = request_hash(inquiry_data)
+        claim = DedupClaim(hashed)
+        try:
+            for key, ttl in self._keys(idempotency_key, hashed):
+                entry = self._wait(key, hashed)
+                if entry is not None:
+                    self.replayed += 1
+                    claim.replay = (InquiryCreateResponse.model_validate(entry["response"]), entry["status"])
+                    # 다른 키로 같은 요청이 다시 와도 재생되도록 선점한 키에 결과 저장
+                    self._store_result(claim, entry)
+                    return claim
+                claim.keys.append((key, ttl))
+        except Exception:
+            self.release(claim)
+            raise
+        return claim
+
+    def _store_result(self, claim: DedupClaim, entry: Dict[str, Any]) -> None:
+        raw = json.dumps(entry)
+        for key, ttl in claim.keys:
+            self.store.set(key, raw, ttl)
+        claim.keys = []
+
+    def complete(self, claim: DedupClaim, response: InquiryCreateResponse, status_code: int) -> None:
+        """처리 결과를 선점한 키에 저장 (이후 같은 요청은 이 응답을 재생)"""
+        self._store_result(claim, {
+            "state": "done",
+            "hash": claim.request_hash,
+            "status": status_code,
+            "response": response.model_dump(),
+        })
+
+    def release(self, claim: DedupClaim) -> None:
+        """처리에 실패한 요청의 선점 해제 (같은 요청을 다시 시도할 수 있도록)"""
+        for key, _ in claim.keys:
+            try:
+                self.store.delete(key)
+            except Exception as e:
+                logger.warning(f"문의 중복 방지 키 해제 실패: {str(e)}")
+        claim.keys = []
+
+    def stats(self) -> Dict[str, int]:
+        return {"replayed": self.replayed, "conflicts": self.conflicts}
+
+
+def _create_store() -> Any:
+    if settings.INQUIRY_DEDUP_STORE == "sqlite":
+        return SQLiteDedupStore(Path(settings.INQUIRY_DEDUP_PATH))
+    return MemoryDedupStore(settings.INQUIRY_DEDUP_MAXSIZE)
+
+
+inquiry_dedup = InquiryDeduplicator(_create_store())
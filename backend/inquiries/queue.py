@@ -0,0 +1,287 @@
+"""
+문의 수집 큐 모듈
+INQUIRY_QUEUE_ENABLED일 때 POST /api/inquiries는 검증한 문의를 로컬 SQLite 큐에
+커밋하고 바로 reference를 반환합니다. 백그라운드 워커가 큐를 오래된 순서로 읽어
+다중 행 INSERT로 DB에 옮깁니다.
+
+- 큐는 WAL + synchronous=FULL로 커밋하므로 응답 후 프로세스가 죽어도 유실되지 않습니다.
+- inquiries.reference 유니크 인덱스에 ON CONFLICT DO NOTHING으로 넣으므로
+  DB 커밋 후 큐에서 지우기 전에 크래시가 나거나 여러 워커가 같은 행을 읽어도 중복되지 않습니다.
+- 배치가 실패하면 한 건씩 다시 넣어 실패한 행만 남기고, 실패가
+  INQUIRY_QUEUE_MAX_ATTEMPTS번 쌓인 행은 inquiry_dead_letter 테이블로 옮겨 큐가 막히지 않게 합니다.
+  DB 연결 오류는 행의 문제가 아니므로 시도 횟수를 늘리지 않고 다음 주기에 재시도합니다.
+"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.database import SessionLocal
+from core.logger import logger
+
+# 행 내용과 무관하게 DB에 닿지 못한 오류 (연결 끊김, 타임아웃 등)
+_TRANSIENT_ERRORS = (OperationalError, InterfaceError)
+
+
+class InquiryQueue:
+    """SQLite 파일 기반 내구성 큐와 배치 적재 워커"""
+
+    def __init__(self, path: Path, session_factory: Callable[[], Session]):
+        self.path = path
+        self.session_factory = session_factory
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+        self.enqueued = 0
+        self.drained = 0
+        self.failures = 0
+        self.dead_lettered = 0
+        self.last_error: Optional[str] = None
+        self.last_drained_at: Optional[float] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """처음 사용할 때 큐 파일을 열고 테이블 생성 (락 안에서 호출)"""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS inquiry_queue ("
+                " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " reference TEXT NOT NULL UNIQUE,"
+                " payload TEXT NOT NULL,"
+                " enqueued_at REAL NOT NULL,"
+                " attempts INTEGER NOT NULL DEFAULT 0)"
+            )
+            # 재시도 한도를 넘긴 문의 (관리자가 원인을 확인하고 직접 처리)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS inquiry_dead_letter ("
+                " seq INTEGER PRIMARY KEY,"
+                " reference TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " enqueued_at REAL NOT NULL,"
+                " attempts INTEGER NOT NULL,"
+                " failed_at REAL NOT NULL,"
+                " error TEXT)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def enqueue(self, reference: str, values: Dict[str, Any]) -> None:
+        """
+        문의 한 건을 큐에 커밋
+
+        Args:
+            reference: 클라이언트에 돌려줄 문의 식별자 (inquiries.reference)
+            values: Inquiry 컬럼 값 (JSON 직렬화 가능해야 함)
+        """
+        payload = json.dumps(values, ensure_ascii=False, default=str)
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT INTO inquiry_queue (reference, payload, enqueued_at) VALUES (?, ?, ?)",
+                (reference, payload, time.time())
+            )
+            conn.commit()
+            self.enqueued += 1
+        self._wakeup.set()
+
+    def _peek(self, limit: int) -> List[Tuple[int, Dict[str, Any]]]:
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT seq, payload FROM inquiry_queue ORDER BY seq LIMIT ?", (limit,)
+            ).fetchall()
+        return [(seq, json.loads(payload)) for seq, payload in rows]
+
+    def _ack(self, seqs: List[int]) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.executemany("DELETE FROM inquiry_queue WHERE seq = ?", [(seq,) for seq in seqs])
+            conn.commit()
+
+    def _record_failure(self, seqs: List[int], error: Exception, count_attempt: bool = True) -> int:
+        """
+        실패한 행의 시도 횟수를 올리고 한도에 닿은 행은 dead-letter 테이블로 이동
+
+        Returns:
+            dead-letter로 옮긴 행 수
+        """
+        max_attempts = settings.INQUIRY_QUEUE_MAX_ATTEMPTS
+        moved = 0
+        with self._lock:
+            conn = self._connection()
+            if count_attempt:
+                params = [(seq,) for seq in seqs]
+                conn.executemany("UPDATE inquiry_queue SET attempts = attempts + 1 WHERE seq = ?", params)
+                if max_attempts > 0:
+                    moved = sum(
+                        conn.execute(
+                            "INSERT INTO inquiry_dead_letter"
+                            " (seq, reference, payload, enqueued_at, attempts, failed_at, error)"
+                            " SELECT seq, reference, payload, enqueued_at, attempts, ?, ?"
+                            " FROM inquiry_queue WHERE seq = ? AND attempts >= ?",
+                            (time.time(), str(error), seq, max_attempts)
+                        ).rowcount
+                        for seq in seqs
+                    )
+                    if moved:
+                        conn.executemany(
+                            "DELETE FROM inquiry_queue WHERE seq = ? AND attempts >= ?",
+                            [(seq, max_attempts) for seq in seqs]
+                        )
+            conn.commit()
+        self.failures += 1
+        self.dead_lettered += moved
+        self.last_error = str(error)
+        return moved
+
+    def _insert(self, rows: List[Dict[str, Any]]) -> None:
+        # 순환 import 방지를 위해 여기서 import
+        from inquiries.service import insert_inquiries
+
+        db = self.session_factory()
+        try:
+            insert_inquiries(db, rows)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _drain_rows(self, batch: List[Tuple[int, Dict[str, Any]]]) -> int:
+        """
+        배치가 실패한 뒤 한 건씩 적재해 실패한 행만 큐에 남김
+
+        Returns:
+            적재한 문의 수 (DB 연결 오류가 나면 그 행부터는 다음 주기에 재시도)
+        """
+        drained = 0
+        for index, (seq, values) in enumerate(batch):
+            try:
+                self._insert([values])
+            except _TRANSIENT_ERRORS as e:
+                self._record_failure([seq for seq, _ in batch[index:]], e, count_attempt=False)
+                logger.error(f"문의 큐 적재 실패 (DB 연결 오류, 다음 주기에 재시도): {str(e)}")
+                break
+            except Exception as e:
+                if self._record_failure([seq], e):
+                    logger.error(
+                        f"문의 {values.get('reference')} 적재가 {settings.INQUIRY_QUEUE_MAX_ATTEMPTS}번 실패해 "
+                        f"dead-letter로 옮겼습니다: {str(e)}"
+                    )
+                else:
+                    logger.error(f"문의 {values.get('reference')} 적재 실패 (다음 주기에 재시도): {str(e)}")
+                continue
+            self._ack([seq])
+            drained += 1
+        return drained
+
+    def drain(self, batch_size: Optional[int] = None) -> int:
+        """
+        큐에 쌓인 문의를 배치 단위로 DB에 적재
+
+        배치 INSERT가 실패하면 그 배치를 한 건씩 다시 적재하고, 실패한 행이 남으면
+        다음 주기에 이어서 처리합니다 (한도를 넘긴 행은 dead-letter로 이동).
+
+        Returns:
+            적재한 문의 수
+        """
+        batch_size = batch_size or settings.INQUIRY_QUEUE_BATCH_SIZE
+        drained = 0
+        while True:
+            batch = self._peek(batch_size)
+            if not batch:
+                break
+            seqs = [seq for seq, _ in batch]
+            try:
+                self._insert([values for _, values in batch])
+            except _TRANSIENT_ERRORS as e:
+                self._record_failure(seqs, e, count_attempt=False)
+                logger.error(f"문의 큐 적재 실패 ({len(batch)}건, DB 연결 오류, 다음 주기에 재시도): {str(e)}")
+                break
+            except Exception as e:
+                logger.warning(f"문의 큐 배치 적재 실패 ({len(batch)}건), 한 건씩 다시 시도합니다: {str(e)}")
+                count = self._drain_rows(batch)
+                drained += count
+                self.drained += count
+                if count:
+                    self.last_drained_at = time.time()
+                # 남은 행은 다음 주기에 다시 시도 (같은 주기에 반복하면 시도 횟수만 소진)
+                break
+            self._ack(seqs)
+            drained += len(batch)
+            self.drained += len(batch)
+            self.last_drained_at = time.time()
+            if len(batch) < batch_size:
+                break
+        return drained
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.is_set():
+            self._wakeup.wait(interval)
+            self._wakeup.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.drain()
+            except Exception as e:
+                logger.error(f"문의 큐 워커 오류: {str(e)}")
+            # 요청이 몰릴 때 한 건씩 INSERT하지 않도록 최소 간격을 두고 모아서 적재
+            self._stop.wait(interval)
+
+    def start(self, interval: Optional[float] = None) -> None:
+        """남아 있는 큐를 적재하는 백그라운드 워커 시작"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(interval or settings.INQUIRY_QUEUE_POLL_SECONDS,),
+            name="inquiry-queue-drain",
+            daemon=True
+        )
+        self._thread.start()
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        """워커를 멈추고 남은 큐를 마지막으로 적재"""
+        if self._thread is not None:
+            self._stop.set()
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+        if self._conn is not None:
+            self.drain()
+
+    def stats(self) -> Dict[str, Any]:
+        """큐 깊이/지연(가장 오래된 항목의 대기 시간) 등 지표"""
+        with self._lock:
+            conn = self._connection()
+            depth, oldest = conn.execute(
+                "SELECT COUNT(*), MIN(enqueued_at) FROM inquiry_queue"
+            ).fetchone()
+            dead_letter, = conn.execute("SELECT COUNT(*) FROM inquiry_dead_letter").fetchone()
+        return {
+            "depth": depth,
+            "lag_seconds": round(time.time() - oldest, 3) if oldest is not None else 0.0,
+            "enqueued": self.enqueued,
+            "drained": self.drained,
+            "failures": self.failures,
+            "dead_letter": dead_letter,
+            "dead_lettered": self.dead_lettered,
+            "last_error": self.last_error,
+            "last_drained_at": self.last_drained_at,
+        }
+
+
+inquiry_queue = InquiryQueue(Path(settings.INQUIRY_QUEUE_PATH), SessionLocal)
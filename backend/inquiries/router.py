@@ -1,17 +1,76 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from core.database import get_db
-from inquiries.service import create_inquiry
-from inquiries.schemas import InquiryCreate, InquiryCreateResponse
+from datetime import datetime
+from fastapi import APIRouter, Depends, Header, Query, Response
+from starlette.concurrency import run_in_threadpool
+from typing import Optional
+from core.config import settings
+from core.database import DBRunner, get_db_runner
+from core.export import export_response
+from core.pagination import CursorPage
+from core.security import require_admin
+from inquiries.dedup import inquiry_dedup
+from inquiries.service import create_inquiry, enqueue_inquiry, get_inquiries_page, inquiry_export_query
+from inquiries.schemas import InquiryCreate, InquiryCreateResponse, InquiryResponse
 
 router = APIRouter(prefix="/inquiries", tags=["inquiries"])
 
 
+@router.get("", response_model=CursorPage[InquiryResponse], dependencies=[Depends(require_admin)])
+async def list_inquiries(
+    status: Optional[str] = Query(None, description="Filter by status (pending, ...)"),
+    service_type: Optional[str] = Query(None, description="Filter by service type"),
+    created_from: Optional[datetime] = Query(None, description="Inclusive lower bound of created_at (ISO 8601)"),
+    created_to: Optional[datetime] = Query(None, description="Exclusive upper bound of created_at (ISO 8601)"),
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    run: DBRunner = Depends(get_db_runner)
+) -> CursorPage[InquiryResponse]:
+    return await run(get_inquiries_page, status, service_type, created_from, created_to, limit, cursor)
+
+
+@router.get("/export", dependencies=[Depends(require_admin)])
+async def export_inquiries(
+    format: str = Query("ndjson", description="ndjson or csv"),
+    status: Optional[str] = Query(None, description="Filter by status (pending, ...)"),
+    service_type: Optional[str] = Query(None, description="Filter by service type"),
+    created_from: Optional[datetime] = Query(None, description="Inclusive lower bound of created_at (ISO 8601)"),
+    created_to: Optional[datetime] = Query(None, description="Exclusive upper bound of created_at (ISO 8601)")
+):
+    return export_response(
+        inquiry_export_query(status, service_type, created_from, created_to),
+        InquiryResponse.model_validate,
+        InquiryResponse,
+        format,
+        "inquiries"
+    )
+
+
 @router.post("", response_model=InquiryCreateResponse, status_code=201)
-def submit_inquiry(
+async def submit_inquiry(
     inquiry_data: InquiryCreate,
-    db: Session = Depends(get_db)
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+    run: DBRunner = Depends(get_db_runner)
 ) -> InquiryCreateResponse:
-    inquiry = create_inquiry(db, inquiry_data)
-    return InquiryCreateResponse(id=inquiry.id)
-
+    # 같은 Idempotency-Key 또는 같은 내용의 반복 제출은 처음 응답을 그대로 재생 (inquiries.dedup)
+    claim = await run_in_threadpool(inquiry_dedup.claim, idempotency_key, inquiry_data)
+    if claim.replay is not None:
+        result, response.status_code = claim.replay
+        response.headers["Idempotent-Replayed"] = "true"
+        return result
+    
+    try:
+        if settings.INQUIRY_QUEUE_ENABLED:
+            # 로컬 큐에 커밋만 하고 응답, DB 적재는 inquiries.queue 워커가 배치로 처리
+            reference = await run_in_threadpool(enqueue_inquiry, inquiry_data)
+            response.status_code = 202
+            result = InquiryCreateResponse(reference=reference, message="Inquiry accepted")
+        else:
+            inquiry = await run(create_inquiry, inquiry_data)
+            response.status_code = 201
+            result = InquiryCreateResponse(id=inquiry.id, reference=inquiry.reference)
+    except BaseException:
+        await run_in_threadpool(inquiry_dedup.release, claim)
+        raise
+    
+    await run_in_threadpool(inquiry_dedup.complete, claim, result, response.status_code)
+    return result
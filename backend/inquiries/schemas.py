@@ -4,15 +4,16 @@ from datetime import datetime
 
 
 class InquiryCreate(BaseModel):
-    name: str
-    email: EmailStr
-    phone: str
-    company: Optional[str] = None
+    # 길이 제한은 inquiries 컬럼 크기와 맞춤 (큐 모드에서 적재 시점에 DB가 거부하지 않도록)
+    name: str = Field(..., max_length=100)
+    email: EmailStr = Field(..., max_length=200)
+    phone: str = Field(..., max_length=50)
+    company: Optional[str] = Field(None, max_length=200)
     message: Optional[str] = None
-    serviceType: Optional[str] = Field(None, alias="service_type")
+    serviceType: Optional[str] = Field(None, alias="service_type", max_length=50)
     selectedFeatures: Optional[List[str]] = Field(None, alias="selected_features")
     additionalFeatures: Optional[str] = Field(None, alias="additional_features")
-    estimatedPrice: Optional[int] = Field(None, alias="estimated_price")
+    estimatedPrice: Optional[int] = Field(None, alias="estimated_price", ge=-2**31, le=2**31 - 1)
     
     class Config:
         populate_by_name = True
@@ -30,6 +31,7 @@ class InquiryResponse(BaseModel):
     additionalFeatures: Optional[str] = Field(None, alias="additional_features")
     estimatedPrice: Optional[int] = Field(None, alias="estimated_price")
     status: str
+    reference: Optional[str] = None
     created_at: datetime
     
     class Config:
@@ -38,6 +40,7 @@ class InquiryResponse(BaseModel):
 
 
 class InquiryCreateResponse(BaseModel):
-    id: int
+    id: Optional[int] = None  # 큐 모드(202)에서는 아직 DB id가 없음
+    reference: str
     message: str = "Inquiry submitted successfully"
 
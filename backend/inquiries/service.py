@@ -1,22 +1,35 @@
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+from sqlalchemy import tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Query, Session
 from inquiries.schemas import InquiryCreate, InquiryResponse
+from inquiries.queue import inquiry_queue
 from core.models import Inquiry
 from core.logger import logger
+from core.exceptions import ValidationException
+from core.pagination import CursorPage, encode_cursor, decode_cursor, cursor_datetime
+
+
+def _inquiry_values(inquiry_data: InquiryCreate) -> Dict[str, Any]:
+    """InquiryCreate -> Inquiry 컬럼 값"""
+    return {
+        "name": inquiry_data.name,
+        "email": inquiry_data.email,
+        "phone": inquiry_data.phone,
+        "company": inquiry_data.company,
+        "message": inquiry_data.message,
+        "service_type": inquiry_data.serviceType,
+        "selected_features": inquiry_data.selectedFeatures,
+        "additional_features": inquiry_data.additionalFeatures,
+        "estimated_price": inquiry_data.estimatedPrice,
+        "status": "pending",
+    }
 
 
 def create_inquiry(db: Session, inquiry_data: InquiryCreate) -> InquiryResponse:
-    inquiry = Inquiry(
-        name=inquiry_data.name,
-        email=inquiry_data.email,
-        phone=inquiry_data.phone,
-        company=inquiry_data.company,
-        message=inquiry_data.message,
-        service_type=inquiry_data.serviceType,
-        selected_features=inquiry_data.selectedFeatures,
-        additional_features=inquiry_data.additionalFeatures,
-        estimated_price=inquiry_data.estimatedPrice,
-        status="pending"
-    )
+    inquiry = Inquiry(reference=uuid4().hex, **_inquiry_values(inquiry_data))
     
     db.add(inquiry)
     db.commit()
@@ -26,3 +39,154 @@ def create_inquiry(db: Session, inquiry_data: InquiryCreate) -> InquiryResponse:
     
     return InquiryResponse.model_validate(inquiry)
 
+
+def enqueue_inquiry(inquiry_data: InquiryCreate) -> str:
+    """
+    문의를 로컬 큐에 넣고 reference 반환 (DB에는 큐 워커가 배치로 적재)
+    
+    Args:
+        inquiry_data: 검증된 문의 데이터
+    
+    Returns:
+        클라이언트에 돌려줄 문의 reference
+    """
+    reference = uuid4().hex
+    values = _inquiry_values(inquiry_data)
+    # 적재 시점이 아니라 접수 시점을 created_at으로 기록
+    values["created_at"] = datetime.now(timezone.utc).isoformat()
+    inquiry_queue.enqueue(reference, {**values, "reference": reference})
+    return reference
+
+
+def insert_inquiries(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """
+    큐에서 꺼낸 문의를 다중 행 INSERT로 적재 (이미 있는 reference는 건너뜀)
+    
+    Args:
+        db: 데이터베이스 세션
+        rows: Inquiry 컬럼 값 목록 (reference 포함)
+    
+    Returns:
+        요청한 행 수
+    """
+    if not rows:
+        return 0
+    
+    rows = [
+        {**row, "created_at": datetime.fromisoformat(row["created_at"])} if row.get("created_at") else row
+        for row in rows
+    ]
+    dialect_insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    db.execute(
+        dialect_insert(Inquiry).values(rows).on_conflict_do_nothing(index_elements=[Inquiry.reference])
+    )
+    db.commit()
+    
+    logger.info(f"Inquiries inserted from queue: {len(rows)}")
+    return len(rows)
+
+
+def _filtered_inquiries(
+    db: Session,
+    status: Optional[str],
+    service_type: Optional[str],
+    created_from: Optional[datetime],
+    created_to: Optional[datetime]
+) -> Query:
+    query = db.query(Inquiry)
+    
+    if status:
+        query = query.filter(Inquiry.status == status)
+    if service_type:
+        query = query.filter(Inquiry.service_type == service_type)
+    if created_from:
+        query = query.filter(Inquiry.created_at >= created_from)
+    if created_to:
+        query = query.filter(Inquiry.created_at < created_to)
+    return query
+
+
+# inquiries.id는 Postgres integer 컬럼
+_MAX_INQUIRY_ID = 2**31 - 1
+
+
+def _decode_inquiry_cursor(cursor: str) -> Tuple[str, int]:
+    """문의 목록 커서 -> (created_at, id) (타입이 맞지 않으면 ValidationException)"""
+    created_at, inquiry_id = decode_cursor(cursor, 2)
+    if not isinstance(created_at, str):
+        raise ValidationException("Invalid cursor")
+    # 문자열/범위를 넘는 id는 Postgres에서 DataError(500)가 남
+    if isinstance(inquiry_id, bool) or not isinstance(inquiry_id, int) or not 0 <= inquiry_id <= _MAX_INQUIRY_ID:
+        raise ValidationException("Invalid cursor")
+    return created_at, inquiry_id
+
+
+def get_inquiries_page(
+    db: Session,
+    status: Optional[str] = None,
+    service_type: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None
+) -> CursorPage[InquiryResponse]:
+    """
+    관리자용 문의 목록 (최신순 키셋 페이지네이션)
+    
+    created_at desc, id desc 순서로 OFFSET 없이 마지막 행 다음부터 limit개를 읽습니다.
+    status/service_type 필터는 각각 (필터 컬럼, created_at, id) 복합 인덱스를 사용합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        status: 상태 필터 (pending 등)
+        service_type: 서비스 유형 필터
+        created_from: 이 시각 이후(포함) 접수된 문의만
+        created_to: 이 시각 이전(미포함) 접수된 문의만
+        limit: 페이지 크기
+        cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+    
+    Returns:
+        items와 next_cursor를 담은 페이지
+    """
+    query = _filtered_inquiries(db, status, service_type, created_from, created_to)
+    if cursor:
+        created_at, inquiry_id = _decode_inquiry_cursor(cursor)
+        query = query.filter(
+            tuple_(Inquiry.created_at, Inquiry.id) < tuple_(cursor_datetime(db, created_at), inquiry_id)
+        )
+    
+    inquiries = (
+        query.order_by(Inquiry.created_at.desc(), Inquiry.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+    
+    next_cursor = None
+    if len(inquiries) > limit:
+        inquiries = inquiries[:limit]
+        last = inquiries[-1]
+        next_cursor = encode_cursor([last.created_at, last.id])
+    
+    return CursorPage[InquiryResponse](
+        items=[InquiryResponse.model_validate(inquiry) for inquiry in inquiries],
+        next_cursor=next_cursor
+    )
+
+
+def inquiry_export_query(
+    status: Optional[str] = None,
+    service_type: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None
+) -> Callable[[Session], Query]:
+    """
+    문의 내보내기 쿼리 생성 함수 (core.export가 자체 세션으로 실행)
+    
+    관리자 목록과 같은 필터와 created_at desc, id desc 순서를 사용합니다.
+    """
+    def build(db: Session) -> Query:
+        return _filtered_inquiries(db, status, service_type, created_from, created_to).order_by(
+            Inquiry.created_at.desc(), Inquiry.id.desc()
+        )
+    
+    return build
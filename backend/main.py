@@ -1,12 +1,18 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from core.compression import CompressionMiddleware
 from core.config import settings
 from core.database import engine, Base, test_connection
 from core.exceptions import BaseAPIException
 from core.logger import logger
+from core.pool_metrics import pool_stats
+from core.rate_limit import RateLimitMiddleware, rate_limiter
 from projects.router import router as projects_router
+from courses.counters import course_counters
 from courses.router import router as courses_router
+from inquiries.dedup import inquiry_dedup
+from inquiries.queue import inquiry_queue
 from inquiries.router import router as inquiries_router
 
 
@@ -16,6 +22,12 @@ def create_app() -> FastAPI:
         version=settings.VERSION
     )
     
+    # 나중에 추가한 미들웨어가 바깥쪽에서 실행되므로 CORS보다 먼저 추가
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE)
+    # 압축보다 바깥에서 실행되어 제한된 요청은 라우터/DB에 닿지 않음 (429에도 CORS 헤더는 붙음)
+    if settings.RATE_LIMIT_ENABLED:
+        app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)
+    
     cors_origins = settings.get_cors_origins()
     logger.info(f"CORS allowed origins: {cors_origins}")
     
@@ -45,6 +57,18 @@ def create_app() -> FastAPI:
             logger.info("Database tables created")
         else:
             logger.warning("Database connection failed, tables not created")
+        # 이전 실행이 남긴 강의 카운터 저널을 복구하고 주기적 flush 시작
+        # (DB 연결이 실패해도 시작, 연결될 때까지 flush를 재시도)
+        course_counters.start()
+        # 큐 워커는 DB 연결이 실패해도 시작 (연결될 때까지 큐에 쌓아 두고 재시도)
+        if settings.INQUIRY_QUEUE_ENABLED:
+            inquiry_queue.start()
+    
+    @app.on_event("shutdown")
+    def shutdown_event():
+        course_counters.stop()
+        if settings.INQUIRY_QUEUE_ENABLED:
+            inquiry_queue.stop()
     
     @app.get("/")
     def root():
@@ -54,6 +78,18 @@ def create_app() -> FastAPI:
     def health_check():
         return {"status": "ok"}
     
+    @app.get("/metrics")
+    def metrics():
+        result = {
+            "course_counters": course_counters.stats(),
+            "inquiry_dedup": inquiry_dedup.stats(),
+            "rate_limit": rate_limiter.stats(),
+            "db_pool": pool_stats(),
+        }
+        if settings.INQUIRY_QUEUE_ENABLED:
+            result["inquiry_queue"] = inquiry_queue.stats()
+        return result
+    
     return app
 
 
@@ -0,0 +1,93 @@
+"""
+프로젝트 패싯 인덱스 모듈
+project_type / tag / tech / status 값 -> 프로젝트 id 집합 역색인
+"""
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set
+
+from core.models import Project
+
+FACET_DIMENSIONS = ("project_type", "tag", "tech", "status")
+
+
+def _facet_values(project: Project) -> Dict[str, List[str]]:
+    return {
+        "project_type": [project.project_type] if project.project_type else [],
+        "tag": list(dict.fromkeys(project.tags or [])),
+        "tech": list(dict.fromkeys(
+            item
+            for tech in (project.technologies or []) if isinstance(tech, dict)
+            for item in (tech.get("items") or [])
+        )),
+        "status": [project.status] if project.status else [],
+    }
+
+
+class ProjectFacetIndex:
+    """
+    패싯 값 -> 프로젝트 id 집합 역색인
+
+    필터는 같은 차원 안에서는 OR(합집합), 차원 사이에서는 AND(교집합)로
+    적용하고, 개수는 일치한 프로젝트의 값만 세므로 O(일치 수)입니다.
+    """
+
+    def __init__(self, projects: Iterable[Project]):
+        # 목록과 같은 정렬 순서로 전달받은 id 순서
+        self.ordered_ids: List[str] = []
+        self._position: Dict[str, int] = {}
+        self._postings: Dict[str, Dict[str, Set[str]]] = {dim: {} for dim in FACET_DIMENSIONS}
+        self._values: Dict[str, Dict[str, List[str]]] = {}
+
+        for project in projects:
+            project_id = str(project.id)
+            values = _facet_values(project)
+            self._position[project_id] = len(self.ordered_ids)
+            self.ordered_ids.append(project_id)
+            self._values[project_id] = values
+            for dim, dim_values in values.items():
+                for value in dim_values:
+                    self._postings[dim].setdefault(value, set()).add(project_id)
+
+    def match(self, filters: Mapping[str, Sequence[str]]) -> Optional[Set[str]]:
+        """필터와 일치하는 id 집합 (필터가 없으면 None = 전체)"""
+        selections: List[Set[str]] = []
+        for dim, values in filters.items():
+            if not values:
+                continue
+            postings = self._postings[dim]
+            selected: Set[str] = set()
+            for value in values:
+                selected |= postings.get(value, set())
+            selections.append(selected)
+
+        if not selections:
+            return None
+
+        # 작은 집합부터 교집합을 구해 중간 결과를 최소화
+        selections.sort(key=len)
+        matched = set(selections[0])
+        for selected in selections[1:]:
+            matched &= selected
+            if not matched:
+                break
+        return matched
+
+    def counts(self, matched: Optional[Set[str]]) -> Dict[str, Dict[str, int]]:
+        """일치한 프로젝트들의 차원별 값 개수"""
+        if matched is None:
+            return {
+                dim: {value: len(ids) for value, ids in postings.items()}
+                for dim, postings in self._postings.items()
+            }
+
+        counts: Dict[str, Dict[str, int]] = {dim: {} for dim in FACET_DIMENSIONS}
+        for project_id in matched:
+            for dim, dim_values in self._values[project_id].items():
+                dim_counts = counts[dim]
+                for value in dim_values:
+                    dim_counts[value] = dim_counts.get(value, 0) + 1
+        return counts
+
+    def ordered(self, matched: Optional[Set[str]]) -> List[str]:
+        if matched is None:
+            return list(self.ordered_ids)
+        return sorted(matched, key=self._position.__getitem__)
@@ -0,0 +1,304 @@
+"""
+프로젝트 일괄 가져오기 모듈
+JSON(data/portfolio_data.json 형식 포함) / NDJSON 파일을 스트리밍으로 읽어
+청크 단위로 검증하고 다중 행 INSERT(또는 priority 기준 upsert)로 반영합니다.
+"""
+import json
+import re
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Set, TextIO, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from core.logger import logger
+from projects.schemas import ProjectCreate, normalize_technologies
+from projects.service import (
+    bulk_create_projects,
+    invalidate_project_cache,
+    upsert_projects,
+)
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+DEFAULT_CHUNK_SIZE = 500
+
+_READ_SIZE = 1 << 20
+_SEPARATOR_RE = re.compile(r"[\s,]*")
+
+# (레코드 번호, 원본 레코드, 파싱 오류)
+RawRecord = Tuple[int, Any, Optional[str]]
+
+
+class ImportReport:
+    """가져오기 결과 (레코드 번호는 JSON 배열 순번 또는 NDJSON 줄 번호, 1부터 시작)"""
+
+    def __init__(self):
+        self.valid = 0
+        self.created: List[str] = []
+        self.updated: List[str] = []
+        self.unchanged: List[str] = []
+        self.errors: List[Tuple[int, str]] = []
+
+
+def _unwrap(record: Any) -> Any:
+    """portfolio_data.json 형식({"project": {...}, "role": {...}})이면 project만 사용"""
+    if isinstance(record, dict) and isinstance(record.get("project"), dict):
+        return record["project"]
+    return record
+
+
+# 원소가 청크 경계에서 잘렸을 때 남는 리터럴 앞부분 (예: "tr", "-")과 숫자 뒷부분 (예: "1." 뒤의 ".")
+_LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+_NUMBER_TAIL_RE = re.compile(r"[\d.eE+-]+")
+
+
+def _is_truncated(buffer: str, error: json.JSONDecodeError) -> bool:
+    """디코딩 오류가 잘못된 JSON이 아니라 원소가 버퍼 끝에서 잘린 탓인지"""
+    rest = buffer[error.pos:]
+    if not rest.strip():
+        return True
+    if error.msg.startswith("Unterminated string"):
+        return True
+    if error.msg.startswith("Invalid \\uXXXX escape") and len(rest) < 6:
+        return True
+    if _NUMBER_TAIL_RE.fullmatch(rest):
+        return True
+    return any(literal.startswith(rest) for literal in _LITERALS)
+
+
+def _read_more(fp: TextIO, buffer: str, pos: int) -> Tuple[str, int, bool]:
+    """pos 이전을 버리고 다음 청크를 이어 붙임 (버퍼, 새 pos, eof)"""
+    chunk = fp.read(_READ_SIZE)
+    return buffer[pos:] + chunk, 0, not chunk
+
+
+def _skip_invalid(fp: TextIO, buffer: str, pos: int, eof: bool) -> Tuple[str, Optional[int], bool]:
+    """
+    잘못된 원소를 건너뛰고 다음 최상위 구분자(',' 또는 배열의 ']') 위치를 찾음
+
+    괄호 깊이와 문자열 안 여부만 추적하고 건너뛴 부분은 버퍼에 남기지 않으므로
+    원소가 아무리 커도 한 번만 읽습니다.
+
+    Returns:
+        (버퍼, 구분자 위치 (파일 끝까지 없으면 None), eof)
+    """
+    depth = 0
+    in_string = escaped = False
+    while True:
+        for i in range(pos, len(buffer)):
+            ch = buffer[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch in "[{":
+                depth += 1
+            elif ch in "]}":
+                if depth == 0:
+                    return buffer, i, eof
+                depth -= 1
+            elif ch == "," and depth == 0:
+                return buffer, i, eof
+        if eof:
+            return buffer, None, eof
+        buffer, pos, eof = _read_more(fp, buffer, len(buffer))
+
+
+def _iter_json_array(fp: TextIO, buffer: str) -> Iterator[Tuple[Any, Optional[str]]]:
+    """
+    '['로 시작하는 JSON 배열을 전체를 메모리에 올리지 않고 원소 단위로 디코딩
+
+    Yields:
+        (원소, None) 또는 잘못된 원소면 (None, 오류 메시지)
+    """
+    decoder = json.JSONDecoder()
+    pos = 1
+    eof = False
+    while True:
+        pos = _SEPARATOR_RE.match(buffer, pos).end()
+        if pos == len(buffer):
+            if eof:
+                yield None, "Invalid JSON: unexpected end of file (missing ']')"
+                return
+            buffer, pos, eof = _read_more(fp, buffer, pos)
+            continue
+        if buffer[pos] == "]":
+            return
+
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            if not eof and _is_truncated(buffer, e):
+                # 원소가 청크 경계에 걸친 경우 다음 청크를 이어 붙여 다시 시도
+                buffer, pos, eof = _read_more(fp, buffer, pos)
+                continue
+            buffer, separator, eof = _skip_invalid(fp, buffer, pos, eof)
+            yield None, f"Invalid JSON: {e.msg}"
+            if separator is None or buffer[separator] == "]":
+                return
+            pos = separator + 1
+            continue
+
+        if not eof and (end == len(buffer) or (
+            isinstance(value, (int, float)) and _NUMBER_TAIL_RE.fullmatch(buffer[end:])
+        )):
+            # 숫자처럼 청크 경계에서 끝난 값은 뒤에 이어지는 부분이 있을 수 있음
+            buffer, pos, eof = _read_more(fp, buffer, pos)
+            continue
+        pos = end
+        yield value, None
+
+
+def iter_records(path: Path) -> Iterator[RawRecord]:
+    """
+    파일에서 프로젝트 레코드를 하나씩 읽음
+
+    - NDJSON(.ndjson/.jsonl): 한 줄에 레코드 하나, 잘못된 줄은 해당 레코드 오류로 보고
+    - JSON 배열: 원소 단위로 스트리밍, 잘못된 원소는 해당 레코드 오류로 보고하고 다음 원소부터 계속
+    - JSON 객체: {"projects": [...]}, {"project": {...}} 또는 레코드 하나
+    """
+    with open(path, encoding="utf-8") as fp:
+        if path.suffix.lower() in NDJSON_SUFFIXES:
+            for lineno, line in enumerate(fp, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield lineno, _unwrap(json.loads(line)), None
+                except json.JSONDecodeError as e:
+                    yield lineno, None, f"Invalid JSON: {e.msg}"
+            return
+
+        head = fp.read(_READ_SIZE).lstrip()
+        if head.startswith("["):
+            for index, (record, error) in enumerate(_iter_json_array(fp, head), start=1):
+                yield index, _unwrap(record), error
+            return
+
+        try:
+            document = json.loads(head + fp.read())
+        except json.JSONDecodeError as e:
+            yield 1, None, f"Invalid JSON: {e.msg}"
+            return
+        if isinstance(document, dict) and isinstance(document.get("projects"), list):
+            records = document["projects"]
+        else:
+            records = [document]
+        for index, record in enumerate(records, start=1):
+            yield index, _unwrap(record), None
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in e['loc']) or 'record'}: {e['msg']}"
+        for e in error.errors()
+    )
+
+
+def validate_record(record: Any) -> ProjectCreate:
+    """레코드를 ProjectCreate로 검증 (레거시 technologies 형태는 정규화)"""
+    if isinstance(record, dict) and "technologies" in record:
+        record = {**record, "technologies": normalize_technologies(record["technologies"])}
+    return ProjectCreate.model_validate(record)
+
+
+def _write(db: Session, projects: List[ProjectCreate], report: ImportReport, upsert: bool) -> None:
+    """
+    프로젝트를 반영하고 커밋이 성공한 뒤에만 보고서에 ID를 추가
+
+    커밋이 실패하면 _write_chunk가 롤백 후 레코드별로 다시 시도하므로, 먼저 추가하면
+    반영되지 않은 ID가 남거나 같은 ID가 두 번 보고됩니다.
+    """
+    if upsert:
+        result = upsert_projects(db, projects)
+    else:
+        result = {"created": bulk_create_projects(db, projects), "updated": [], "unchanged": []}
+    db.commit()
+    report.created.extend(result["created"])
+    report.updated.extend(result["updated"])
+    report.unchanged.extend(result["unchanged"])
+
+
+def _write_chunk(
+    db: Session,
+    chunk: List[Tuple[int, ProjectCreate]],
+    report: ImportReport,
+    upsert: bool
+) -> None:
+    """청크를 한 번에 반영, 실패하면 레코드별로 다시 시도해 실패한 레코드만 오류로 보고"""
+    try:
+        _write(db, [project for _, project in chunk], report, upsert)
+        return
+    except SQLAlchemyError:
+        db.rollback()
+
+    for number, project in chunk:
+        try:
+            _write(db, [project], report, upsert)
+        except SQLAlchemyError as e:
+            db.rollback()
+            report.errors.append((number, str(getattr(e, "orig", None) or e).strip()))
+
+
+def import_projects(
+    db: Session,
+    path: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dry_run: bool = False,
+    upsert: bool = False
+) -> ImportReport:
+    """
+    파일의 프로젝트를 청크 단위로 검증 후 일괄 추가
+
+    Args:
+        db: 데이터베이스 세션
+        path: JSON 또는 NDJSON 파일 경로
+        chunk_size: 한 번의 INSERT로 추가할 레코드 수
+        dry_run: True면 검증만 하고 추가하지 않음
+        upsert: True면 priority를 자연 키로 새 프로젝트는 추가하고 변경된 프로젝트만 갱신
+
+    Returns:
+        유효 레코드 수, 생성/갱신/유지된 ID, 레코드별 오류
+    """
+    report = ImportReport()
+    chunk: List[Tuple[int, ProjectCreate]] = []
+    seen_priorities: Set[int] = set()
+
+    for number, record, error in iter_records(path):
+        if error is None:
+            try:
+                project = validate_record(record)
+            except ValidationError as e:
+                error = _format_validation_error(e)
+            else:
+                if upsert and project.priority <= 0:
+                    error = "priority: must be greater than 0 to upsert"
+                elif upsert and project.priority in seen_priorities:
+                    error = f"priority: duplicate priority {project.priority}"
+                else:
+                    seen_priorities.add(project.priority)
+                    chunk.append((number, project))
+                    report.valid += 1
+        if error is not None:
+            report.errors.append((number, error))
+
+        if len(chunk) >= chunk_size:
+            if not dry_run:
+                _write_chunk(db, chunk, report, upsert)
+            chunk = []
+
+    if chunk and not dry_run:
+        _write_chunk(db, chunk, report, upsert)
+
+    if report.created or report.updated:
+        invalidate_project_cache()
+    logger.info(
+        f"프로젝트 가져오기 완료: {path} (유효 {report.valid}개, 생성 {len(report.created)}개, "
+        f"갱신 {len(report.updated)}개, 유지 {len(report.unchanged)}개, 오류 {len(report.errors)}개)"
+    )
+    return report
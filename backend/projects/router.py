@@ -1,33 +1,162 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from typing import Optional, List
-from core.database import get_db
-from projects.service import get_projects, get_project_by_id, create_project
-from projects.schemas import ProjectListResponse, ProjectDetailResponse, ProjectCreate
+from fastapi import APIRouter, Depends, Query, Request, Response
+from typing import Optional, List, Union
+from core.config import settings
+from core.database import DBRunner, get_db_runner
+from core.export import export_response
+from core.etag import etag_matches, make_etag, not_modified, set_etag
+from core.fieldsets import json_response, parse_fields, partial_model
+from core.params import parse_id_list
+from core.security import require_admin
+from projects.service import (
+    get_projects,
+    get_projects_snapshot,
+    get_projects_page,
+    get_projects_fields,
+    get_projects_by_ids,
+    project_export_query,
+    project_to_detail,
+    search_projects,
+    get_project_facets,
+    get_project_by_id,
+    get_project_fields_by_id,
+    create_project,
+    get_projects_etag,
+    get_project_etag,
+)
+from projects.schemas import (
+    ProjectListResponse,
+    ProjectDetailResponse,
+    ProjectCreate,
+    ProjectPageResponse,
+    ProjectBatchResponse,
+    ProjectSearchResult,
+    ProjectFacetsResponse,
+)
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
-@router.get("", response_model=List[ProjectListResponse])
-def list_projects(
+@router.get("", response_model=Union[List[ProjectListResponse], ProjectPageResponse])
+async def list_projects(
+    request: Request,
+    response: Response,
     project_type: Optional[str] = Query(None, description="Filter by project type (web, mobile, desktop, fullstack, backend, frontend)"),
-    db: Session = Depends(get_db)
-) -> List[ProjectListResponse]:
-    return get_projects(db, project_type)
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Page size; returns a cursor page instead of the full list"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated ProjectListResponse fields to return"),
+    run: DBRunner = Depends(get_db_runner)
+) -> Union[List[ProjectListResponse], ProjectPageResponse]:
+    selected = parse_fields(fields, ProjectListResponse)
+    etag = await run(get_projects_etag, project_type)
+    if selected:
+        etag = make_etag(etag, selected)
+    
+    if limit is not None or cursor is not None:
+        limit = limit or 20
+        etag = make_etag(etag, cursor, limit)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        page = await run(get_projects_page, project_type, limit, cursor, selected)
+        if selected:
+            result = json_response(page, type(page))
+            set_etag(result, etag)
+            return result
+        set_etag(response, etag)
+        return page
+    
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    if selected:
+        result = json_response(
+            await run(get_projects_fields, project_type, selected),
+            List[partial_model(ProjectListResponse, selected)]
+        )
+        set_etag(result, etag)
+        return result
+    if settings.PROJECT_SNAPSHOT_ENABLED:
+        snapshot = Response(
+            content=await run(get_projects_snapshot, project_type),
+            media_type="application/json"
+        )
+        set_etag(snapshot, etag)
+        return snapshot
+    set_etag(response, etag)
+    return await run(get_projects, project_type)
+
+
+@router.get("/search", response_model=List[ProjectSearchResult])
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Search query"),
+    limit: int = Query(20, ge=1, le=100),
+    run: DBRunner = Depends(get_db_runner)
+) -> List[ProjectSearchResult]:
+    return await run(search_projects, q, limit)
+
+
+@router.get("/facets", response_model=ProjectFacetsResponse)
+async def facets(
+    project_type: List[str] = Query([], description="Filter by project type (repeatable)"),
+    tag: List[str] = Query([], description="Filter by tag (repeatable)"),
+    tech: List[str] = Query([], description="Filter by technology item (repeatable)"),
+    status: List[str] = Query([], description="Filter by status (repeatable)"),
+    run: DBRunner = Depends(get_db_runner)
+) -> ProjectFacetsResponse:
+    return await run(
+        get_project_facets,
+        {"project_type": project_type, "tag": tag, "tech": tech, "status": status}
+    )
+
+
+@router.get("/batch", response_model=ProjectBatchResponse)
+async def get_projects_batch(
+    ids: str = Query(..., description="Comma-separated project ids"),
+    run: DBRunner = Depends(get_db_runner)
+) -> ProjectBatchResponse:
+    return await run(get_projects_by_ids, parse_id_list(ids))
+
+
+# 전체 테이블을 스트리밍하는 동안 커넥션을 점유하므로 문의 내보내기처럼 관리자 전용
+@router.get("/export", dependencies=[Depends(require_admin)])
+async def export_projects(
+    format: str = Query("ndjson", description="ndjson or csv"),
+    project_type: Optional[str] = Query(None, description="Filter by project type")
+):
+    return export_response(
+        project_export_query(project_type),
+        project_to_detail,
+        ProjectDetailResponse,
+        format,
+        "projects"
+    )
 
 
 @router.get("/{project_id}", response_model=ProjectDetailResponse)
-def get_project(
+async def get_project(
     project_id: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None, description="Comma-separated ProjectDetailResponse fields to return"),
+    run: DBRunner = Depends(get_db_runner)
 ) -> ProjectDetailResponse:
-    return get_project_by_id(db, project_id)
+    selected = parse_fields(fields, ProjectDetailResponse)
+    etag = await run(get_project_etag, project_id)
+    if selected:
+        etag = make_etag(etag, selected)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    if selected:
+        project = await run(get_project_fields_by_id, project_id, selected)
+        result = json_response(project, type(project))
+        set_etag(result, etag)
+        return result
+    set_etag(response, etag)
+    return await run(get_project_by_id, project_id)
 
 
 @router.post("", response_model=ProjectDetailResponse, status_code=201)
-def create_new_project(
+async def create_new_project(
     project_data: ProjectCreate,
-    db: Session = Depends(get_db)
+    run: DBRunner = Depends(get_db_runner)
 ) -> ProjectDetailResponse:
-    return create_project(db, project_data)
+    return await run(create_project, project_data)
 
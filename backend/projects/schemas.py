@@ -1,11 +1,81 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, ValidationError, WrapValidator, field_validator
+from typing import Annotated, Optional, List, Dict, Any
 from datetime import datetime, date
+from core.logger import logger
+from core.pagination import CursorPage
 
 
 class Technology(BaseModel):
     category: str
     items: List[str]
+    
+    @field_validator("category")
+    @classmethod
+    def category_not_blank(cls, v: str) -> str:
+        v = v.strip()
+        if not v:
+            raise ValueError("category must not be blank")
+        return v
+    
+    @field_validator("items")
+    @classmethod
+    def strip_items(cls, v: List[str]) -> List[str]:
+        return [item.strip() for item in v if item.strip()]
+
+
+def normalize_technologies(technologies: Any) -> Any:
+    """레거시 technologies 형태(문자열 배열, {name, category} 배열)를 {category, items}로 변환"""
+    if not technologies:
+        return []
+    if isinstance(technologies, list):
+        if all(isinstance(t, dict) and "category" in t and "items" in t for t in technologies):
+            return technologies
+        if all(isinstance(t, dict) and "name" in t and "category" in t for t in technologies):
+            grouped: Dict[str, List[str]] = {}
+            for t in technologies:
+                category = t.get("category") or "기술"
+                name = t.get("name")
+                if not name:
+                    continue
+                if category not in grouped:
+                    grouped[category] = []
+                grouped[category].append(name)
+            return [{"category": c, "items": items} for c, items in grouped.items()]
+        if all(isinstance(t, str) for t in technologies):
+            return [{"category": "기술 스택", "items": technologies}]
+    return technologies
+
+
+def _tolerant_technologies(value: Any, handler: Any) -> List[Technology]:
+    """
+    응답용 technologies 검증 (백필되지 않은 행이 있어도 목록 전체가 500이 되지 않도록)
+    
+    저장된 값은 쓰기 시점에 정규화되므로 보통은 그대로 통과하고,
+    검증에 실패한 경우에만 레거시 형태를 변환한 뒤 여전히 잘못된 항목은 버립니다.
+    """
+    try:
+        return handler(value)
+    except ValidationError:
+        pass
+    
+    logger.warning("정규화되지 않은 technologies를 읽기 시점에 변환합니다 (scripts.normalize_technologies 실행 필요)")
+    normalized = normalize_technologies(value)
+    try:
+        return handler(normalized)
+    except ValidationError:
+        pass
+    
+    result: List[Technology] = []
+    for item in normalized if isinstance(normalized, list) else []:
+        try:
+            result.append(Technology.model_validate(item))
+        except ValidationError:
+            continue
+    return result
+
+
+# 응답 스키마의 technologies (partial_model로 만든 부분 응답에도 그대로 적용됨)
+ResponseTechnologies = Annotated[List[Technology], WrapValidator(_tolerant_technologies)]
 
 
 class Feature(BaseModel):
@@ -65,7 +135,7 @@ class ProjectListResponse(BaseModel):
     start_date: date
     end_date: Optional[date] = None
     is_ongoing: bool
-    technologies: List[Technology] = []
+    technologies: ResponseTechnologies = []
     tags: List[str] = []
     github_url: Optional[str] = None
     demo_url: Optional[str] = None
@@ -77,11 +147,31 @@ class ProjectListResponse(BaseModel):
         populate_by_name = True
 
 
+ProjectPageResponse = CursorPage[ProjectListResponse]
+
+
+class ProjectSearchResult(ProjectListResponse):
+    rank: float
+    highlight: Optional[str] = None  # description 일치 부분 (<mark>로 강조)
+
+
 class ProjectDetailResponse(ProjectBase):
     id: str
+    technologies: ResponseTechnologies = []
     created_at: datetime
     updated_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
         populate_by_name = True
+
+
+class ProjectBatchResponse(BaseModel):
+    items: List[ProjectDetailResponse]  # 요청한 id 순서
+    missing: List[str] = []  # 존재하지 않는 id
+
+
+class ProjectFacetsResponse(BaseModel):
+    total: int  # 필터와 일치한 프로젝트 수
+    ids: List[str]  # 일치한 프로젝트 id (목록과 같은 정렬 순서)
+    facets: Dict[str, Dict[str, int]]  # project_type/tag/tech/status -> 값별 개수
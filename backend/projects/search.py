@@ -0,0 +1,122 @@
+"""
+프로젝트 검색 인덱스 모듈
+Postgres가 아닌 환경(SQLite 로컬 개발 등)에서 사용하는 메모리 역색인
+"""
+import bisect
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from core.models import Project
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Postgres projects_search_vector의 A/B/C 가중치와 같은 우선순위
+FIELD_WEIGHTS = {
+    "title": 1.0,
+    "subtitle": 0.4,
+    "tags": 0.4,
+    "technologies": 0.4,
+    "description": 0.2,
+}
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _technology_items(technologies) -> List[str]:
+    items: List[str] = []
+    for tech in technologies or []:
+        if isinstance(tech, dict):
+            items.extend(tech.get("items") or [])
+    return items
+
+
+class ProjectSearchIndex:
+    """
+    토큰 -> {project_id: 가중치 점수} 역색인
+
+    검색어의 각 토큰을 접두어로 매칭하고(Postgres의 :* 와 동일), 모든 토큰을
+    포함하는 프로젝트만 점수 합계 순으로 반환합니다.
+    """
+
+    def __init__(self, projects: Iterable[Project]):
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._descriptions: Dict[str, str] = {}
+        self._priorities: Dict[str, int] = {}
+
+        for project in projects:
+            project_id = str(project.id)
+            self._descriptions[project_id] = project.description or ""
+            self._priorities[project_id] = project.priority or 0
+            fields = {
+                "title": tokenize(project.title),
+                "subtitle": tokenize(project.subtitle),
+                "tags": [t for tag in (project.tags or []) for t in tokenize(tag)],
+                "technologies": [
+                    t for item in _technology_items(project.technologies) for t in tokenize(item)
+                ],
+                "description": tokenize(project.description),
+            }
+            for field, tokens in fields.items():
+                weight = FIELD_WEIGHTS[field]
+                for token in tokens:
+                    scores = self._postings.setdefault(token, {})
+                    scores[project_id] = scores.get(project_id, 0.0) + weight
+
+        self._terms = sorted(self._postings)
+
+    def _prefix_scores(self, prefix: str) -> Dict[str, float]:
+        """prefix로 시작하는 모든 토큰의 점수 합"""
+        scores: Dict[str, float] = {}
+        start = bisect.bisect_left(self._terms, prefix)
+        for term in self._terms[start:]:
+            if not term.startswith(prefix):
+                break
+            for project_id, score in self._postings[term].items():
+                scores[project_id] = scores.get(project_id, 0.0) + score
+        return scores
+
+    def search(self, query: str, limit: int) -> List[Tuple[str, float]]:
+        """검색어와 일치하는 (project_id, rank) 목록을 rank 내림차순으로 반환"""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+
+        totals: Optional[Dict[str, float]] = None
+        for token in tokens:
+            scores = self._prefix_scores(token)
+            if totals is None:
+                totals = scores
+            else:
+                matched: Set[str] = totals.keys() & scores.keys()
+                totals = {pid: totals[pid] + scores[pid] for pid in matched}
+            if not totals:
+                return []
+
+        # 동점이면 목록과 같은 priority 내림차순
+        ranked = sorted(
+            totals.items(),
+            key=lambda item: (item[1], self._priorities.get(item[0], 0)),
+            reverse=True
+        )
+        return ranked[:limit]
+
+    def highlight(self, project_id: str, query: str, window: int = 60) -> Optional[str]:
+        """description에서 첫 일치 위치 주변을 잘라 일치 부분을 <mark>로 감쌈"""
+        text = self._descriptions.get(project_id) or ""
+        tokens = tokenize(query)
+        if not text or not tokens:
+            return None
+
+        pattern = re.compile("|".join(re.escape(t) for t in tokens), re.IGNORECASE)
+        match = pattern.search(text)
+        if not match:
+            return None
+
+        start = max(match.start() - window, 0)
+        end = min(match.end() + window, len(text))
+        snippet = pattern.sub(lambda m: f"<mark>{m.group(0)}</mark>", text[start:end])
+        return ("..." if start > 0 else "") + snippet + ("..." if end < len(text) else "")
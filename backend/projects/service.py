@@ -1,74 +1,581 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional, Any, Dict
+from pydantic import TypeAdapter
+from sqlalchemy import func, insert, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Query, Session, load_only
+from typing import Callable, List, Optional, Any, Dict, Tuple
 from uuid import UUID, uuid4
-from core.exceptions import NotFoundException
+from core.cache import TTLCache
+from core.config import settings
+from core.etag import make_etag
+from core.fieldsets import partial_model
+from core.exceptions import ConflictException, NotFoundException, ValidationException
 from core.models import Project
-from projects.schemas import ProjectListResponse, ProjectDetailResponse, ProjectCreate
+from core.pagination import CursorPage, encode_cursor, decode_cursor, cursor_datetime
+from projects.schemas import (
+    ProjectListResponse,
+    ProjectDetailResponse,
+    ProjectCreate,
+    ProjectBatchResponse,
+    ProjectSearchResult,
+    ProjectFacetsResponse,
+    Technology,
+    normalize_technologies,
+)
+from projects.facets import ProjectFacetIndex
+from projects.search import ProjectSearchIndex, tokenize
 from core.logger import logger
 
 
-def _normalize_technologies(technologies: Any) -> Any:
-    if not technologies:
-        return []
-    if isinstance(technologies, list):
-        if all(isinstance(t, dict) and "category" in t and "items" in t for t in technologies):
-            return technologies
-        if all(isinstance(t, dict) and "name" in t and "category" in t for t in technologies):
-            grouped: Dict[str, List[str]] = {}
-            for t in technologies:
-                category = t.get("category") or "기술"
-                name = t.get("name")
-                if not name:
-                    continue
-                if category not in grouped:
-                    grouped[category] = []
-                grouped[category].append(name)
-            return [{"category": c, "items": items} for c, items in grouped.items()]
-        if all(isinstance(t, str) for t in technologies):
-            return [{"category": "기술 스택", "items": technologies}]
-    return technologies
+# ("list", project_type) -> List[ProjectListResponse]
+# ("snapshot", project_type) -> 인코딩된 JSON 바이트
+# ("fields", project_type, fields) -> 부분 응답 모델 리스트
+# ("search_index",) -> (ProjectSearchIndex, {id: ProjectListResponse}) (Postgres 외 환경)
+# ("facet_index",) -> ProjectFacetIndex
+_project_list_cache = TTLCache(
+    maxsize=settings.PROJECT_CACHE_MAXSIZE,
+    ttl=settings.PROJECT_CACHE_TTL_SECONDS
+)
+
+# (project_type, cursor, limit, fields) -> ProjectPageResponse 또는 부분 페이지
+# 키에 클라이언트가 보낸 커서가 들어가므로, 커서를 넘기며 요청해도 목록/스냅샷/ETag 항목이
+# 밀려나지 않도록 별도의 작은 캐시에 둡니다.
+_project_page_cache = TTLCache(
+    maxsize=settings.PROJECT_PAGE_CACHE_MAXSIZE,
+    ttl=settings.PROJECT_CACHE_TTL_SECONDS
+)
+
+
+# ("etag", project_id) -> 마지막으로 DB에서 계산한 상세 ETag
+# ("detail", project_id, fields) -> (응답을 만든 행의 ETag, ProjectDetailResponse 또는 부분 응답 모델)
+# id별 항목이 많아도 목록/스냅샷/역색인 항목이 밀려나지 않도록 목록 캐시와 분리하고,
+# 행의 ETag가 현재 ETag와 같을 때만 재사용하므로 외부 쓰기도 다음 요청에서 반영됩니다.
+_project_detail_cache = TTLCache(
+    maxsize=settings.PROJECT_DETAIL_CACHE_MAXSIZE,
+    ttl=settings.PROJECT_CACHE_TTL_SECONDS
+)
+
+# ("list", project_type) -> 캐시된 응답을 만들 때 DB에서 집계한 목록 ETag
+# 스크립트(import_projects 등)처럼 다른 프로세스의 쓰기는 이 프로세스의 캐시를 비우지 못하므로
+# 요청마다 집계한 ETag를 이 값과 비교해 달라지면 캐시를 비웁니다 (_track_list_etag).
+_list_etags: Dict[Tuple[Any, ...], str] = {}
+# project_type은 클라이언트가 보낸 값이므로 개수를 제한 (넘으면 캐시와 함께 비움)
+_MAX_LIST_ETAGS = settings.PROJECT_CACHE_MAXSIZE
+
+
+# 목록 응답에 필요한 컬럼만 조회하고 detailed_description, code_snippets 등
+# 무거운 컬럼은 지연 로딩으로 남겨 둠
+_LIST_COLUMNS = [getattr(Project, name) for name in ProjectListResponse.model_fields]
+
+_project_list_adapter = TypeAdapter(List[ProjectListResponse])
+
+
+def invalidate_project_cache() -> None:
+    """프로젝트 쓰기 후 목록 캐시를 비움"""
+    _project_list_cache.clear()
+    _project_page_cache.clear()
+    _project_detail_cache.clear()
+    _list_etags.clear()
+
+
+def _track_list_etag(project_type: Optional[str], etag: str) -> None:
+    """DB에서 집계한 목록 ETag가 캐시된 응답의 기준과 다르면 (외부 쓰기) 캐시를 비움"""
+    key = ("list", project_type)
+    previous = _list_etags.get(key)
+    if previous is not None and previous != etag:
+        logger.info("프로젝트가 외부에서 변경되어 프로젝트 캐시를 비웁니다.")
+        invalidate_project_cache()
+    elif previous is None and len(_list_etags) >= _MAX_LIST_ETAGS:
+        invalidate_project_cache()
+    _list_etags[key] = etag
+
+
+def _columns_for(fields: Tuple[str, ...]) -> List[Any]:
+    """응답 필드명 -> 조회할 Project 컬럼 (응답 필드는 모두 같은 이름의 컬럼)"""
+    return [getattr(Project, name) for name in fields]
+
+
+def _project_to_dict(project: Project) -> Dict[str, Any]:
+    """
+    로드된 컬럼만 dict로 변환 (지연 로딩 컬럼은 포함하지 않음)
+    
+    technologies는 쓰기 시점(create_project, backfill_technologies)에
+    {category, items} 형태로 저장되므로 읽기 경로에서는 정규화하지 않습니다.
+    """
+    return {
+        k: str(v) if k == 'id' and isinstance(v, UUID) else v
+        for k, v in project.__dict__.items() if not k.startswith('_')
+    }
+
+
+def backfill_technologies(db: Session, dry_run: bool = False) -> int:
+    """
+    저장된 technologies를 {category, items} 형태로 일괄 변환 (1회성 마이그레이션)
+    
+    Args:
+        db: 데이터베이스 세션
+        dry_run: True면 변경 대상만 로그로 출력하고 커밋하지 않음
+    
+    Returns:
+        변환된(또는 변환 대상인) 프로젝트 수
+    
+    Raises:
+        ValueError: 변환할 수 없는 프로젝트가 하나라도 있으면 (아무것도 커밋하지 않음)
+    """
+    projects = db.query(Project).options(load_only(Project.id, Project.title, Project.technologies)).all()
+    
+    updated = 0
+    failed: List[str] = []
+    for project in projects:
+        normalized = normalize_technologies(project.technologies)
+        try:
+            canonical = [Technology.model_validate(t).model_dump() for t in normalized]
+        except (TypeError, ValueError) as e:
+            logger.error(f"프로젝트 '{project.title}' (ID: {project.id})의 technologies를 변환할 수 없습니다: {e}")
+            failed.append(str(project.id))
+            continue
+        if canonical == project.technologies:
+            continue
+        
+        logger.info(f"프로젝트 '{project.title}' (ID: {project.id})의 technologies를 변환합니다.")
+        if not dry_run:
+            project.technologies = canonical
+        updated += 1
+    
+    if failed:
+        # 일부만 변환된 상태로 배포되지 않도록 아무것도 커밋하지 않고 실패 처리
+        db.rollback()
+        raise ValueError(
+            f"technologies를 변환할 수 없는 프로젝트 {len(failed)}개: {', '.join(failed)} "
+            "(직접 수정한 뒤 다시 실행하세요)"
+        )
+    
+    if dry_run:
+        db.rollback()
+    else:
+        db.commit()
+        invalidate_project_cache()
+    
+    return updated
 
 
 def get_projects(
     db: Session,
     project_type: Optional[str] = None
 ) -> List[ProjectListResponse]:
-    query = db.query(Project)
+    cached = _project_list_cache.get(("list", project_type))
+    if cached is not None:
+        return list(cached)
+    
+    generation = _project_list_cache.generation
+    query = db.query(Project).options(load_only(*_LIST_COLUMNS))
     
     if project_type:
         query = query.filter(Project.project_type == project_type)
     
     projects = query.order_by(Project.priority.desc(), Project.created_at.desc()).all()
     
-    result = []
-    for project in projects:
-        project_dict = {
-            k: str(v) if k == 'id' and isinstance(v, UUID) else v
-            for k, v in project.__dict__.items() if not k.startswith('_')
-        }
-        if "technologies" in project_dict:
-            project_dict["technologies"] = _normalize_technologies(project_dict["technologies"])
-        result.append(ProjectListResponse.model_validate(project_dict))
+    result = [
+        ProjectListResponse.model_validate(_project_to_dict(project))
+        for project in projects
+    ]
     
-    return result
+    _project_list_cache.set(("list", project_type), result, generation)
+    return list(result)
+
+
+def get_projects_fields(
+    db: Session,
+    project_type: Optional[str],
+    fields: Tuple[str, ...]
+) -> List[Any]:
+    """
+    요청한 필드만 조회/직렬화하는 프로젝트 목록 (?fields=)
+    
+    Args:
+        db: 데이터베이스 세션
+        project_type: 프로젝트 타입 필터
+        fields: parse_fields로 검증된 ProjectListResponse 필드명
+    
+    Returns:
+        fields만 담은 부분 응답 모델 리스트
+    """
+    cache_key = ("fields", project_type, fields)
+    cached = _project_list_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
+    
+    generation = _project_list_cache.generation
+    model = partial_model(ProjectListResponse, fields)
+    query = db.query(Project).options(load_only(*_columns_for(fields)))
+    
+    if project_type:
+        query = query.filter(Project.project_type == project_type)
+    
+    projects = query.order_by(Project.priority.desc(), Project.created_at.desc()).all()
+    result = [model.model_validate(_project_to_dict(project)) for project in projects]
+    
+    _project_list_cache.set(cache_key, result, generation)
+    return list(result)
+
+
+def _build_search_index(db: Session) -> Tuple[ProjectSearchIndex, Dict[str, ProjectListResponse]]:
+    projects = db.query(Project).options(load_only(*_LIST_COLUMNS)).all()
+    responses = {
+        str(project.id): ProjectListResponse.model_validate(_project_to_dict(project))
+        for project in projects
+    }
+    return ProjectSearchIndex(projects), responses
+
+
+def search_projects(
+    db: Session,
+    q: str,
+    limit: int = 20
+) -> List[ProjectSearchResult]:
+    """
+    프로젝트 전문 검색 (title, subtitle, description, tags, technologies.items)
+    
+    Postgres에서는 projects_search_vector 함수와 GIN 인덱스
+    (database/migration_add_project_search.sql)를 사용하고, 그 외 DB(SQLite 로컬
+    개발)에서는 Project 테이블로 만든 메모리 역색인을 사용합니다. 두 경우 모두
+    검색어 토큰을 접두어로 매칭하고 모든 토큰을 포함하는 결과만 반환합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        q: 검색어
+        limit: 최대 결과 수
+    
+    Returns:
+        rank 내림차순 검색 결과
+    """
+    tokens = list(dict.fromkeys(tokenize(q)))
+    if not tokens:
+        return []
+    
+    if db.get_bind().dialect.name != "postgresql":
+        # 캐시된 역색인을 쓰기 전에 외부 쓰기 확인
+        get_projects_etag(db)
+        index, responses = _project_list_cache.get_or_set(
+            ("search_index",), lambda: _build_search_index(db)
+        )
+        return [
+            ProjectSearchResult(
+                **responses[project_id].model_dump(),
+                rank=rank,
+                highlight=index.highlight(project_id, q)
+            )
+            for project_id, rank in index.search(q, limit)
+        ]
+    
+    document = func.projects_search_vector(
+        Project.title, Project.subtitle, Project.description, Project.tags, Project.technologies
+    )
+    tsquery = func.to_tsquery("simple", " & ".join(f"{token}:*" for token in tokens))
+    rank = func.ts_rank(document, tsquery).label("rank")
+    highlight = func.ts_headline(
+        "simple",
+        Project.description,
+        tsquery,
+        "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MinWords=5, MaxWords=25"
+    ).label("highlight")
+    
+    rows = (
+        db.query(Project, rank, highlight)
+        .options(load_only(*_LIST_COLUMNS))
+        .filter(document.op("@@")(tsquery))
+        .order_by(rank.desc(), Project.priority.desc())
+        .limit(limit)
+        .all()
+    )
+    
+    return [
+        ProjectSearchResult.model_validate({**_project_to_dict(project), "rank": row_rank, "highlight": row_highlight})
+        for project, row_rank, row_highlight in rows
+    ]
+
+
+def _build_facet_index(db: Session) -> ProjectFacetIndex:
+    projects = (
+        db.query(Project)
+        .options(load_only(Project.id, Project.project_type, Project.tags, Project.technologies, Project.status))
+        .order_by(Project.priority.desc(), Project.created_at.desc())
+        .all()
+    )
+    return ProjectFacetIndex(projects)
+
+
+def get_project_facets(
+    db: Session,
+    filters: Dict[str, List[str]]
+) -> ProjectFacetsResponse:
+    """
+    패싯(project_type, tag, tech, status)별 프로젝트 개수 조회
+    
+    Project 테이블로 만든 역색인(값 -> id 집합)을 프로젝트 캐시에 두고 쓰기 시
+    함께 무효화합니다. 필터는 같은 차원 안에서는 OR, 차원 사이에서는 AND입니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        filters: 차원 -> 선택한 값 리스트 (예: {"tag": ["React"], "tech": ["FastAPI"]})
+    
+    Returns:
+        일치한 프로젝트 수/id와 차원별 값 개수
+    """
+    # 캐시된 역색인을 쓰기 전에 외부 쓰기 확인
+    get_projects_etag(db)
+    index = _project_list_cache.get_or_set(("facet_index",), lambda: _build_facet_index(db))
+    matched = index.match(filters)
+    ids = index.ordered(matched)
+    return ProjectFacetsResponse(total=len(ids), ids=ids, facets=index.counts(matched))
+
+
+def _is_uuid(value: str) -> bool:
+    try:
+        UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _decode_project_cursor(cursor: str) -> Tuple[int, str, str]:
+    """프로젝트 목록 커서 -> (priority, created_at, id) (타입이 맞지 않으면 ValidationException)"""
+    priority, created_at, project_id = decode_cursor(cursor, 3)
+    if isinstance(priority, bool) or not isinstance(priority, int):
+        raise ValidationException("Invalid cursor")
+    if not isinstance(created_at, str) or not isinstance(project_id, str):
+        raise ValidationException("Invalid cursor")
+    # Postgres의 projects.id는 uuid 컬럼이므로 형식이 다르면 DataError(500)가 남
+    if not _is_uuid(project_id):
+        raise ValidationException("Invalid cursor")
+    return priority, created_at, project_id
+
+
+def get_projects_page(
+    db: Session,
+    project_type: Optional[str] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    fields: Optional[Tuple[str, ...]] = None
+) -> CursorPage:
+    """
+    키셋 페이지네이션으로 프로젝트 목록 조회
+    
+    get_projects와 같은 priority desc, created_at desc 순서에 id desc를
+    동순위 구분 키로 더해, OFFSET 없이 마지막 행 다음부터 limit개를 읽습니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        project_type: 프로젝트 타입 필터
+        limit: 페이지 크기
+        cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+        fields: 지정하면 해당 필드만 조회/직렬화
+    
+    Returns:
+        items와 next_cursor를 담은 페이지
+    """
+    cache_key = (project_type, cursor, limit, fields)
+    cached = _project_page_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    generation = _project_page_cache.generation
+    columns = _columns_for(fields) if fields else _LIST_COLUMNS
+    item_model = partial_model(ProjectListResponse, fields) if fields else ProjectListResponse
+    query = db.query(Project).options(
+        load_only(*columns, Project.priority, Project.created_at)
+    )
+    
+    if project_type:
+        query = query.filter(Project.project_type == project_type)
+    
+    if cursor:
+        priority, created_at, project_id = _decode_project_cursor(cursor)
+        query = query.filter(
+            tuple_(Project.priority, Project.created_at, Project.id)
+            < tuple_(priority, cursor_datetime(db, created_at), project_id)
+        )
+    
+    projects = (
+        query.order_by(Project.priority.desc(), Project.created_at.desc(), Project.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+    
+    next_cursor = None
+    if len(projects) > limit:
+        projects = projects[:limit]
+        last = projects[-1]
+        next_cursor = encode_cursor([last.priority, last.created_at, last.id])
+    
+    page = CursorPage[item_model](
+        items=[item_model.model_validate(_project_to_dict(p)) for p in projects],
+        next_cursor=next_cursor
+    )
+    _project_page_cache.set(cache_key, page, generation)
+    return page
+
+
+def get_projects_snapshot(
+    db: Session,
+    project_type: Optional[str] = None
+) -> bytes:
+    """
+    프로젝트 목록을 JSON 바이트로 미리 인코딩해 캐시
+    
+    라우터는 이 바이트를 Response로 바로 반환하므로 요청마다 response_model
+    재검증과 JSON 인코딩을 하지 않습니다. 쓰기 시 목록 캐시와 함께 무효화됩니다.
+    """
+    return _project_list_cache.get_or_set(
+        ("snapshot", project_type),
+        lambda: _project_list_adapter.dump_json(get_projects(db, project_type))
+    )
+
+
+def get_projects_etag(
+    db: Session,
+    project_type: Optional[str] = None
+) -> str:
+    """
+    프로젝트 목록의 ETag 계산
+    
+    행 개수와 created_at/updated_at 최댓값만 집계하므로 본문을 만들지 않고도
+    목록 변경 여부를 판단할 수 있습니다. 외부 쓰기를 감지할 수 있도록 요청마다 계산합니다.
+    """
+    query = db.query(
+        func.count(Project.id),
+        func.max(Project.created_at),
+        func.max(Project.updated_at)
+    )
+    if project_type:
+        query = query.filter(Project.project_type == project_type)
+    count, last_created, last_updated = query.one()
+    etag = make_etag("projects", project_type, count, last_created, last_updated)
+    _track_list_etag(project_type, etag)
+    return etag
+
+
+def get_project_etag(
+    db: Session,
+    project_id: str
+) -> str:
+    """프로젝트 상세의 ETag 계산 (요청마다 기본 키로 조회, 존재하지 않으면 NotFoundException)"""
+    row = (
+        db.query(Project.id, Project.created_at, Project.updated_at)
+        .filter(Project.id == project_id)
+        .first()
+    )
+    if not row:
+        raise NotFoundException("Project", project_id)
+    etag = _detail_etag(row)
+    _project_detail_cache.set(("etag", project_id), etag)
+    return etag
+
+
+def _detail_etag(row: Any) -> str:
+    """프로젝트 상세의 ETag (id, created_at, updated_at을 조회한 행)"""
+    return make_etag("project", row.id, row.created_at, row.updated_at)
+
+
+def _cached_detail(project_id: str, fields: Optional[Tuple[str, ...]]) -> Any:
+    """현재 상세 ETag와 같은 행으로 만든 캐시된 응답 (없거나 달라졌으면 None)"""
+    cached = _project_detail_cache.get(("detail", project_id, fields))
+    if cached is None or cached[0] != _project_detail_cache.get(("etag", project_id)):
+        return None
+    return cached[1]
 
 
 def get_project_by_id(
     db: Session,
     project_id: str
 ) -> ProjectDetailResponse:
+    cached = _cached_detail(project_id, None)
+    if cached is not None:
+        return cached
+    
+    generation = _project_detail_cache.generation
     project = db.query(Project).filter(Project.id == project_id).first()
     
     if not project:
         raise NotFoundException("Project", project_id)
     
-    project_dict = {
-        k: str(v) if k == 'id' and isinstance(v, UUID) else v
-        for k, v in project.__dict__.items() if not k.startswith('_')
-    }
-    if "technologies" in project_dict:
-        project_dict["technologies"] = _normalize_technologies(project_dict["technologies"])
-    return ProjectDetailResponse.model_validate(project_dict)
+    detail = ProjectDetailResponse.model_validate(_project_to_dict(project))
+    _project_detail_cache.set(("detail", project_id, None), (_detail_etag(project), detail), generation)
+    return detail
+
+
+def project_export_query(project_type: Optional[str] = None) -> Callable[[Session], Query]:
+    """
+    프로젝트 내보내기 쿼리 생성 함수 (core.export가 자체 세션으로 실행)
+    
+    목록과 같은 priority desc, created_at desc, id desc 순서 (idx_projects_list_order)
+    """
+    def build(db: Session) -> Query:
+        query = db.query(Project)
+        if project_type:
+            query = query.filter(Project.project_type == project_type)
+        return query.order_by(Project.priority.desc(), Project.created_at.desc(), Project.id.desc())
+    
+    return build
+
+
+def project_to_detail(project: Project) -> ProjectDetailResponse:
+    return ProjectDetailResponse.model_validate(_project_to_dict(project))
+
+
+def get_projects_by_ids(
+    db: Session,
+    project_ids: List[str]
+) -> ProjectBatchResponse:
+    """
+    여러 프로젝트를 한 번의 WHERE id IN (...) 쿼리로 조회
+    
+    Args:
+        db: 데이터베이스 세션
+        project_ids: 조회할 프로젝트 ID 리스트 (중복 제거 후 순서 유지)
+    
+    Returns:
+        요청 순서대로 정렬된 프로젝트와 찾지 못한 id 목록 (UUID 형식이 아닌 id 포함)
+    """
+    # uuid 컬럼에 형식이 다른 값을 넘기면 배치 전체가 DataError로 실패하므로 미리 걸러 missing 처리
+    valid_ids = [project_id for project_id in project_ids if _is_uuid(project_id)]
+    projects = db.query(Project).filter(Project.id.in_(valid_ids)).all() if valid_ids else []
+    by_id = {str(project.id): project for project in projects}
+    
+    return ProjectBatchResponse(
+        items=[
+            ProjectDetailResponse.model_validate(_project_to_dict(by_id[project_id]))
+            for project_id in project_ids if project_id in by_id
+        ],
+        missing=[project_id for project_id in project_ids if project_id not in by_id]
+    )
+
+
+def get_project_fields_by_id(
+    db: Session,
+    project_id: str,
+    fields: Tuple[str, ...]
+) -> Any:
+    """요청한 필드만 조회/직렬화하는 프로젝트 상세 (?fields=)"""
+    cached = _cached_detail(project_id, fields)
+    if cached is not None:
+        return cached
+    
+    generation = _project_detail_cache.generation
+    # 캐시 항목의 ETag를 계산하도록 created_at/updated_at도 함께 조회 (부분 모델은 추가 필드를 무시)
+    project = (
+        db.query(Project)
+        .options(load_only(*_columns_for(fields), Project.created_at, Project.updated_at))
+        .filter(Project.id == project_id)
+        .first()
+    )
+    
+    if not project:
+        raise NotFoundException("Project", project_id)
+    
+    detail = partial_model(ProjectDetailResponse, fields).model_validate(_project_to_dict(project))
+    _project_detail_cache.set(("detail", project_id, fields), (_detail_etag(project), detail), generation)
+    return detail
 
 
 def update_project_screenshots(
@@ -95,16 +602,11 @@ def update_project_screenshots(
     project.screenshots = screenshots
     db.commit()
     db.refresh(project)
+    invalidate_project_cache()
     
     logger.info(f"프로젝트 '{project.title}' (ID: {project_id})의 screenshots를 {len(screenshots)}개로 업데이트했습니다.")
     
-    project_dict = {
-        k: str(v) if k == 'id' and isinstance(v, UUID) else v
-        for k, v in project.__dict__.items() if not k.startswith('_')
-    }
-    if "technologies" in project_dict:
-        project_dict["technologies"] = _normalize_technologies(project_dict["technologies"])
-    return ProjectDetailResponse.model_validate(project_dict)
+    return ProjectDetailResponse.model_validate(_project_to_dict(project))
 
 
 def get_project_by_priority(
@@ -127,13 +629,52 @@ def get_project_by_priority(
         logger.warning(f"Priority {priority}인 프로젝트를 찾을 수 없습니다.")
         return None
     
-    project_dict = {
-        k: str(v) if k == 'id' and isinstance(v, UUID) else v
-        for k, v in project.__dict__.items() if not k.startswith('_')
+    return ProjectDetailResponse.model_validate(_project_to_dict(project))
+
+
+def _project_values(project_data: ProjectCreate) -> Dict[str, Any]:
+    """ProjectCreate -> projects 테이블 컬럼 값 (id 제외, JSON 컬럼은 dict로 변환)"""
+    return {
+        "title": project_data.title,
+        "subtitle": project_data.subtitle,
+        "description": project_data.description,
+        "project_type": project_data.project_type,
+        "app_icon": project_data.app_icon,
+        "start_date": project_data.start_date,
+        "end_date": project_data.end_date,
+        "is_ongoing": project_data.is_ongoing,
+        "technologies": [tech.model_dump() for tech in project_data.technologies],
+        "features": [feature.model_dump() for feature in project_data.features],
+        "code_snippets": [snippet.model_dump() for snippet in (project_data.code_snippets or [])],
+        "github_url": project_data.github_url,
+        "demo_url": project_data.demo_url,
+        "documentation_url": project_data.documentation_url,
+        "screenshots": project_data.screenshots or [],
+        "detailed_description": project_data.detailed_description,
+        "challenges": project_data.challenges,
+        "achievements": project_data.achievements,
+        "lines_of_code": project_data.lines_of_code,
+        "commit_count": project_data.commit_count,
+        "contributor_count": project_data.contributor_count,
+        "tags": project_data.tags or [],
+        "status": project_data.status,
+        "priority": project_data.priority,
+        "client": project_data.client
     }
-    if "technologies" in project_dict:
-        project_dict["technologies"] = _normalize_technologies(project_dict["technologies"])
-    return ProjectDetailResponse.model_validate(project_dict)
+
+
+def _is_priority_conflict(error: IntegrityError) -> bool:
+    """uq_projects_priority(priority > 0 부분 유니크 인덱스) 위반인지 확인"""
+    orig = error.orig
+    # psycopg2는 diag, asyncpg는 원본 예외(__cause__)에 제약 조건 이름이 있음
+    constraint = (
+        getattr(getattr(orig, "diag", None), "constraint_name", None)
+        or getattr(orig.__cause__, "constraint_name", None)
+    )
+    if constraint is not None:
+        return constraint == "uq_projects_priority"
+    # SQLite는 제약 조건 이름 대신 컬럼을 알려줌
+    return "UNIQUE constraint failed: projects.priority" in str(orig)
 
 
 def create_project(
@@ -154,44 +695,123 @@ def create_project(
     project_id = str(uuid4())
     
     # Project 모델 생성
-    project = Project(
-        id=project_id,
-        title=project_data.title,
-        subtitle=project_data.subtitle,
-        description=project_data.description,
-        project_type=project_data.project_type,
-        app_icon=project_data.app_icon,
-        start_date=project_data.start_date,
-        end_date=project_data.end_date,
-        is_ongoing=project_data.is_ongoing,
-        technologies=[tech.model_dump() for tech in project_data.technologies],
-        features=[feature.model_dump() for feature in project_data.features],
-        code_snippets=[snippet.model_dump() for snippet in (project_data.code_snippets or [])],
-        github_url=project_data.github_url,
-        demo_url=project_data.demo_url,
-        documentation_url=project_data.documentation_url,
-        screenshots=project_data.screenshots or [],
-        detailed_description=project_data.detailed_description,
-        challenges=project_data.challenges,
-        achievements=project_data.achievements,
-        lines_of_code=project_data.lines_of_code,
-        commit_count=project_data.commit_count,
-        contributor_count=project_data.contributor_count,
-        tags=project_data.tags or [],
-        status=project_data.status,
-        priority=project_data.priority,
-        client=project_data.client
-    )
+    project = Project(id=project_id, **_project_values(project_data))
     
     db.add(project)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if _is_priority_conflict(e):
+            raise ConflictException(f"Project with priority {project.priority} already exists")
+        raise
     db.refresh(project)
+    invalidate_project_cache()
     
     logger.info(f"새 프로젝트 '{project.title}' (ID: {project_id}, Priority: {project.priority})를 생성했습니다.")
     
-    project_dict = {
-        k: str(v) if k == 'id' and isinstance(v, UUID) else v
-        for k, v in project.__dict__.items() if not k.startswith('_')
-    }
-    return ProjectDetailResponse.model_validate(project_dict)
+    return ProjectDetailResponse.model_validate(_project_to_dict(project))
+
+
+def bulk_create_projects(
+    db: Session,
+    projects: List[ProjectCreate]
+) -> List[str]:
+    """
+    여러 프로젝트를 다중 행 INSERT ... RETURNING으로 추가
+    
+    행마다 commit/refresh하는 create_project와 달리 커밋과 캐시 무효화는
+    호출자가 청크 단위로 수행합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        projects: 검증된 프로젝트 생성 데이터 목록
+    
+    Returns:
+        projects와 같은 순서의 생성된 프로젝트 ID 목록
+    """
+    if not projects:
+        return []
+    
+    rows = [{"id": str(uuid4()), **_project_values(p)} for p in projects]
+    result = db.execute(
+        insert(Project).returning(Project.id, sort_by_parameter_order=True),
+        rows
+    )
+    return [str(project_id) for project_id in result.scalars()]
 
+
+def upsert_projects(
+    db: Session,
+    projects: List[ProjectCreate]
+) -> Dict[str, List[str]]:
+    """
+    priority를 자연 키로 프로젝트를 upsert (재실행해도 중복 생성하지 않음)
+    
+    저장된 행과 컬럼 단위로 비교해 새 프로젝트와 변경된 프로젝트만
+    INSERT ... ON CONFLICT (priority) DO UPDATE 한 번으로 반영합니다.
+    변경이 없는 프로젝트는 건드리지 않으므로 updated_at(ETag, sitemap lastmod)이 유지됩니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        projects: 프로젝트 생성 데이터 목록 (priority > 0, 서로 중복 불가)
+    
+    Returns:
+        {"created": [...], "updated": [...], "unchanged": [...]} 프로젝트 ID 목록
+    """
+    priorities = [p.priority for p in projects]
+    if any(priority <= 0 for priority in priorities):
+        raise ValidationException("priority must be greater than 0 to upsert")
+    if len(set(priorities)) != len(priorities):
+        raise ValidationException("Duplicate priority in upsert batch")
+    
+    result: Dict[str, List[str]] = {"created": [], "updated": [], "unchanged": []}
+    if not projects:
+        return result
+    
+    existing = {
+        row.priority: row
+        for row in db.query(Project).filter(Project.priority.in_(priorities))
+    }
+    
+    rows: List[Dict[str, Any]] = []
+    changed_columns: Dict[str, None] = {}
+    for project_data in projects:
+        values = _project_values(project_data)
+        row = existing.get(project_data.priority)
+        if row is None:
+            rows.append({"id": str(uuid4()), **values})
+            continue
+        changed = [name for name, value in values.items() if getattr(row, name) != value]
+        if not changed:
+            result["unchanged"].append(str(row.id))
+            continue
+        changed_columns.update(dict.fromkeys(changed))
+        rows.append({"id": str(row.id), **values})
+    
+    if not rows:
+        return result
+    
+    dialect_insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    stmt = dialect_insert(Project).values(rows)
+    # 변경되지 않은 컬럼은 excluded 값이 저장된 값과 같으므로 변경된 컬럼만 실제로 바뀜
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Project.priority],
+        index_where=Project.priority > 0,
+        set_={
+            **{name: stmt.excluded[name] for name in changed_columns},
+            "updated_at": func.now(),
+        }
+    )
+    created_ids = {row["id"] for row in rows if row["priority"] not in existing}
+    for project_id in db.execute(stmt.returning(Project.id)).scalars():
+        result["created" if project_id in created_ids else "updated"].append(str(project_id))
+    db.commit()
+    invalidate_project_cache()
+    
+    logger.info(
+        f"프로젝트 upsert: 생성 {len(result['created'])}개, "
+        f"변경 {len(result['updated'])}개, 유지 {len(result['unchanged'])}개"
+    )
+    
+    return result
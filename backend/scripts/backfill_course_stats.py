@@ -0,0 +1,43 @@
+"""
+강의 커리큘럼 통계 백필 스크립트
+
+migration_add_course_curriculum_stats.sql 적용 후, 기존 강의의 curriculum에서
+레슨 수/무료 레슨 수/총 재생 시간을 계산해 저장합니다. 새 강의는 생성 시 자동으로 계산됩니다.
+
+사용법:
+    python -m scripts.backfill_course_stats            # 계산 후 커밋
+    python -m scripts.backfill_course_stats --dry-run  # 변경 대상 수만 출력
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from core.database import SessionLocal
+from core.logger import logger
+from courses.service import backfill_curriculum_stats
+
+
+def main():
+    dry_run = "--dry-run" in sys.argv[1:]
+    
+    db = SessionLocal()
+    try:
+        count = backfill_curriculum_stats(db, dry_run=dry_run)
+        if dry_run:
+            print(f"통계 변경 대상 강의: {count}개 (dry-run, 커밋하지 않음)")
+        else:
+            print(f"✅ {count}개 강의의 커리큘럼 통계를 갱신했습니다.")
+    except Exception as e:
+        logger.error(f"커리큘럼 통계 백필 실패: {str(e)}")
+        print(f"❌ 커리큘럼 통계 백필 실패: {str(e)}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
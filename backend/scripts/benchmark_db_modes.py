@@ -0,0 +1,144 @@
+"""
+DB 실행 모드(DB_ASYNC) 비교 벤치마크 스크립트
+
+같은 DB에 대해 동기 모드(스레드풀)와 비동기 모드(AsyncSession.run_sync)로 앱을 각각
+별도 프로세스에서 띄우고, 동시 요청을 보내 처리량/지연 시간과 이벤트 루프 지연을 측정합니다.
+
+- 이벤트 루프 지연: 10ms마다 깨어나는 작업이 실제로 얼마나 늦게 깨어났는지의 최댓값.
+  비동기 모드에서는 검증/직렬화 같은 CPU 작업이 루프를 점유하므로 이 값이 커집니다.
+- --cold: 요청마다 프로젝트/강의 캐시를 비워 캐시 미스(CPU 작업이 가장 많은 경우)를 측정합니다.
+
+사용법:
+    python -m scripts.benchmark_db_modes
+    python -m scripts.benchmark_db_modes --requests 2000 --concurrency 50 --cold
+    DATABASE_URL=postgresql+psycopg2://... python -m scripts.benchmark_db_modes --path /api/projects/facets
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# 프로젝트 루트를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+DEFAULT_PATHS = ["/api/projects", "/api/projects?limit=20", "/api/courses", "/api/projects/facets"]
+
+
+async def _measure_loop_lag(stop: asyncio.Event, samples: List[float]) -> None:
+    interval = 0.01
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append((time.perf_counter() - start - interval) * 1000)
+
+
+async def _run_worker(args: argparse.Namespace) -> Dict[str, Any]:
+    # 설정은 import 시점에 읽으므로 환경 변수(DB_ASYNC)를 지정한 자식 프로세스에서만 import
+    import httpx
+
+    from courses.service import invalidate_course_cache
+    from main import app
+    from projects.service import invalidate_project_cache
+
+    await app.router.startup()
+    latencies: List[float] = []
+    errors = 0
+    lag_samples: List[float] = []
+    stop = asyncio.Event()
+    queue: "asyncio.Queue[str]" = asyncio.Queue()
+    for i in range(args.requests):
+        queue.put_nowait(args.paths[i % len(args.paths)])
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        # 캐시를 채운 뒤 측정 (--cold면 어차피 요청마다 비움)
+        for path in args.paths:
+            await client.get(path)
+
+        async def worker() -> None:
+            nonlocal errors
+            while True:
+                try:
+                    path = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                if args.cold:
+                    invalidate_project_cache()
+                    invalidate_course_cache()
+                start = time.perf_counter()
+                response = await client.get(path)
+                latencies.append((time.perf_counter() - start) * 1000)
+                if response.status_code >= 400:
+                    errors += 1
+
+        lag_task = asyncio.create_task(_measure_loop_lag(stop, lag_samples))
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await lag_task
+
+    await app.router.shutdown()
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 2),
+        "max_ms": round(latencies[-1], 2),
+        "loop_lag_max_ms": round(max(lag_samples, default=0.0), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동기/비동기 DB 모드 처리량과 이벤트 루프 지연 비교")
+    parser.add_argument("--requests", type=int, default=1000, help="모드별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 요청 수")
+    parser.add_argument("--path", dest="paths", action="append", help=f"요청 경로 (반복 가능, 기본: {DEFAULT_PATHS})")
+    parser.add_argument("--cold", action="store_true", help="요청마다 캐시를 비워 캐시 미스 비용 측정")
+    parser.add_argument("--worker", choices=["sync", "async"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    args.paths = args.paths or DEFAULT_PATHS
+
+    if args.worker:
+        print(json.dumps(asyncio.run(_run_worker(args))))
+        return
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for mode in ("sync", "async"):
+        command = [
+            sys.executable, "-m", "scripts.benchmark_db_modes", "--worker", mode,
+            "--requests", str(args.requests), "--concurrency", str(args.concurrency),
+            *[option for path in args.paths for option in ("--path", path)],
+            *(["--cold"] if args.cold else []),
+        ]
+        env = {
+            **os.environ,
+            "DB_ASYNC": "true" if mode == "async" else "false",
+            # 벤치마크 요청이 속도 제한에 걸리지 않도록 (읽기만 보내지만 명시적으로 끔)
+            "RATE_LIMIT_ENABLED": "false",
+            "LOG_LEVEL": "WARNING",
+        }
+        completed = subprocess.run(command, cwd=backend_dir, env=env, capture_output=True, text=True)
+        if completed.returncode != 0:
+            print(f"❌ {mode} 모드 실행 실패:\n{completed.stderr}")
+            sys.exit(1)
+        results[mode] = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    columns = ["requests", "errors", "rps", "p50_ms", "p95_ms", "max_ms", "loop_lag_max_ms"]
+    print(f"경로: {', '.join(args.paths)} | 동시 요청 {args.concurrency}{' | cold' if args.cold else ''}")
+    print(f"{'mode':<6} " + " ".join(f"{name:>16}" for name in columns))
+    for mode, result in results.items():
+        print(f"{mode:<6} " + " ".join(f"{result[name]:>16}" for name in columns))
+
+
+if __name__ == "__main__":
+    main()
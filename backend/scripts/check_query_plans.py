@@ -0,0 +1,300 @@
+"""
+쿼리 플랜 회귀 검사 스크립트
+
+로컬 Postgres의 임시 스키마(query_plan_check)에 테이블과 database/ 마이그레이션을 적용하고
+대량의 합성 데이터를 넣은 뒤, projects / courses / inquiries 서비스 함수가 실제로 실행하는
+SELECT 쿼리마다 EXPLAIN (ANALYZE)을 실행합니다.
+플랜에 Seq Scan 또는 Sort 노드가 있으면 실패(종료 코드 1)합니다.
+
+- 데이터 크기와 무관하게 "이 쿼리를 처리할 인덱스가 있는가"를 검사하기 위해
+  enable_seqscan / enable_sort를 끈 상태로 플랜을 만듭니다. 인덱스가 없으면
+  비활성화된 노드라도 Seq Scan / Sort가 그대로 남습니다.
+- 테이블 전체를 집계하는 ETag 쿼리와 rank 정렬이 필요한 전문 검색은
+  ALLOWED_NODES에 예외로 등록합니다. (항목별 근거는 ALLOWED_NODES 주석 참고)
+
+운영 DB의 데이터는 건드리지 않지만(임시 스키마만 생성/삭제), 로컬 또는 스테이징 Postgres에서만 실행하세요.
+
+사용법:
+    python -m scripts.check_query_plans postgresql+psycopg2://postgres@localhost:5432/portfolio
+    QUERY_PLAN_DATABASE_URL=... python -m scripts.check_query_plans --projects 50000 --courses 5000 --inquiries 100000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+from uuid import UUID
+
+# 프로젝트 루트를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from core.database import Base
+from core.models import Course, Inquiry, Project
+from courses import service as course_service
+from inquiries import service as inquiry_service
+from projects import service as project_service
+
+SCHEMA = "query_plan_check"
+
+# 스키마에 적용할 마이그레이션 (테이블은 모델로 생성)
+MIGRATIONS = [
+    "migration_add_project_list_indexes.sql",
+    "migration_add_project_search.sql",
+    "migration_add_project_priority_key.sql",
+    "migration_add_course_indexes.sql",
+    "migration_add_inquiry_reference.sql",
+    "migration_add_inquiry_indexes.sql",
+]
+
+BAD_NODES = {"Seq Scan", "Sort", "Incremental Sort"}
+
+# 쿼리 라벨 -> 허용하는 노드 (사유는 모듈 docstring 참고)
+ALLOWED_NODES = {
+    # 필터 없는 count/max 집계는 인덱스로 대신할 수 없음 (외부 쓰기 감지를 위해 요청마다 실행하지만,
+    # 포트폴리오 프로젝트는 수백 행 이하라 전체 스캔 비용이 작음)
+    "projects.etag(all)": {"Seq Scan"},
+    # ts_rank 순서는 검색어마다 달라 인덱스 순서로 읽을 수 없음 (GIN 인덱스로 후보를 줄인 뒤 정렬)
+    "projects.search": {"Sort"},
+    # 필터 없는 count/max 집계, courses는 행 수가 수십 개 수준이라 요청마다 실행해도 전체 스캔 비용이 작음
+    "courses.etag": {"Seq Scan"},
+}
+
+PROJECT_TYPES = ["web", "mobile", "desktop", "fullstack", "backend", "frontend"]
+STATUSES = ["planning", "development", "completed", "maintenance"]
+WORDS = [
+    "react", "fastapi", "routine", "dashboard", "chat", "invest", "portfolio", "commerce",
+    "analytics", "mobile", "desktop", "realtime", "payment", "search", "supabase", "electron",
+]
+INQUIRY_STATUSES = ["pending", "contacted", "closed"]
+SERVICE_TYPES = ["web", "app", "consulting"]
+TECHNOLOGIES = ["React", "TypeScript", "FastAPI", "Python", "Supabase", "Vite", "Electron", "Capacitor"]
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def load_synthetic_data(
+    engine,
+    project_count: int,
+    course_count: int,
+    inquiry_count: int,
+    seed: int = 42
+) -> None:
+    """합성 프로젝트/강의/문의 데이터를 1000행 단위 다중 행 INSERT로 적재 후 ANALYZE"""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+
+    projects = []
+    for i in range(project_count):
+        created = now - timedelta(minutes=i)
+        projects.append({
+            "id": str(UUID(int=i + 1)),
+            "title": f"{_sentence(rng, 3)} {i}",
+            "subtitle": _sentence(rng, 6),
+            "description": _sentence(rng, 40),
+            "project_type": rng.choice(PROJECT_TYPES),
+            "start_date": date(2020, 1, 1) + timedelta(days=i % 1500),
+            "is_ongoing": rng.random() < 0.2,
+            "technologies": [{"category": "기술 스택", "items": rng.sample(TECHNOLOGIES, 3)}],
+            "features": [],
+            "code_snippets": [],
+            "screenshots": [],
+            "tags": rng.sample(WORDS, 3),
+            "status": rng.choice(STATUSES),
+            # 일부만 priority 지정 (0은 미지정, uq_projects_priority 대상 아님)
+            "priority": i + 1 if i < project_count // 10 else 0,
+            "created_at": created,
+            "updated_at": created if rng.random() < 0.5 else None,
+        })
+
+    courses = []
+    for i in range(course_count):
+        created = now - timedelta(minutes=i)
+        courses.append({
+            "type": rng.choice(["video", "ebook"]),
+            "title": f"{_sentence(rng, 3)} {i}",
+            "description": _sentence(rng, 30),
+            "price": rng.randint(0, 100) * 1000,
+            "rating": round(rng.uniform(3, 5), 1),
+            "level": rng.choice(["beginner", "intermediate", "advanced"]),
+            "instructor_name": "instructor",
+            "instructor_bio": _sentence(rng, 8),
+            "what_you_learn": [_sentence(rng, 4)],
+            "curriculum": [],
+            "requirements": [],
+            "created_at": created,
+        })
+
+    inquiries = []
+    for i in range(inquiry_count):
+        inquiries.append({
+            "name": f"client {i}",
+            "email": f"client{i}@example.com",
+            "phone": "010-0000-0000",
+            "message": _sentence(rng, 20),
+            "service_type": rng.choice(SERVICE_TYPES),
+            "selected_features": rng.sample(WORDS, 2),
+            "status": rng.choice(INQUIRY_STATUSES),
+            "created_at": now - timedelta(seconds=i * 30),
+        })
+
+    tables = ((Project.__table__, projects), (Course.__table__, courses), (Inquiry.__table__, inquiries))
+    with engine.begin() as connection:
+        for table, rows in tables:
+            for start in range(0, len(rows), 1000):
+                connection.execute(table.insert(), rows[start:start + 1000])
+        for table, _ in tables:
+            connection.exec_driver_sql(f"ANALYZE {table.name}")
+
+
+def service_calls(db: Session) -> List[Tuple[str, Callable[[], Any]]]:
+    """(라벨, 서비스 함수 호출) 목록 - 각 호출이 실행하는 SELECT가 검사 대상"""
+    project_id = db.query(Project.id).filter(Project.priority == 1).scalar()
+    project_ids = [project_id, db.query(Project.id).filter(Project.priority == 2).scalar()]
+    course_id = db.query(Course.id).order_by(Course.id).limit(1).scalar()
+    first_page = project_service.get_projects_page(db, None, 20)
+    inquiry_page = inquiry_service.get_inquiries_page(db, limit=20)
+    week_ago = datetime.now(timezone.utc) - timedelta(days=7)
+
+    return [
+        ("projects.list(all)", lambda: project_service.get_projects(db)),
+        ("projects.list(type)", lambda: project_service.get_projects(db, "web")),
+        ("projects.list_fields(type)", lambda: project_service.get_projects_fields(db, "web", ("id", "title"))),
+        ("projects.page(first)", lambda: project_service.get_projects_page(db, None, 20)),
+        ("projects.page(cursor)", lambda: project_service.get_projects_page(db, None, 20, first_page.next_cursor)),
+        ("projects.page(type)", lambda: project_service.get_projects_page(db, "mobile", 20)),
+        ("projects.etag(all)", lambda: project_service.get_projects_etag(db)),
+        ("projects.etag(type)", lambda: project_service.get_projects_etag(db, "web")),
+        ("projects.detail_etag", lambda: project_service.get_project_etag(db, project_id)),
+        ("projects.detail", lambda: project_service.get_project_by_id(db, project_id)),
+        ("projects.detail_fields", lambda: project_service.get_project_fields_by_id(db, project_id, ("title",))),
+        ("projects.batch", lambda: project_service.get_projects_by_ids(db, project_ids)),
+        ("projects.by_priority", lambda: project_service.get_project_by_priority(db, 2)),
+        ("projects.search", lambda: project_service.search_projects(db, "react dash", 20)),
+        ("projects.facet_index_build", lambda: project_service.get_project_facets(db, {"tag": ["react"]})),
+        ("courses.list", lambda: course_service.get_courses(db)),
+        ("courses.list_fields", lambda: course_service.get_courses_fields(db, ("id", "title"))),
+        ("courses.etag", lambda: course_service.get_courses_etag(db)),
+        ("courses.detail_etag", lambda: course_service.get_course_etag(db, course_id)),
+        ("courses.detail", lambda: course_service.get_course_by_id(db, course_id)),
+        ("courses.detail_fields", lambda: course_service.get_course_fields_by_id(db, course_id, ("title",))),
+        ("courses.batch", lambda: course_service.get_courses_by_ids(db, [course_id, course_id + 1])),
+        ("inquiries.page(first)", lambda: inquiry_service.get_inquiries_page(db, limit=20)),
+        ("inquiries.page(cursor)", lambda: inquiry_service.get_inquiries_page(db, limit=20, cursor=inquiry_page.next_cursor)),
+        ("inquiries.page(status)", lambda: inquiry_service.get_inquiries_page(db, status="pending", limit=20)),
+        ("inquiries.page(service_type)", lambda: inquiry_service.get_inquiries_page(db, service_type="app", limit=20)),
+        ("inquiries.page(range)", lambda: inquiry_service.get_inquiries_page(db, created_from=week_ago, limit=20)),
+    ]
+
+
+def capture_queries(engine, call: Callable[[], Any]) -> List[Tuple[str, Any]]:
+    """call() 실행 중 발생한 SELECT 문과 파라미터를 수집"""
+    captured: List[Tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        project_service.invalidate_project_cache()
+        course_service.invalidate_course_cache()
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return captured
+
+
+def _plan_nodes(plan: Dict[str, Any]) -> List[str]:
+    nodes = [plan["Node Type"]]
+    for child in plan.get("Plans", []):
+        nodes.extend(_plan_nodes(child))
+    return nodes
+
+
+def explain(engine, statement: str, parameters: Any) -> Tuple[List[str], float]:
+    """인덱스 외 경로를 비활성화한 상태의 EXPLAIN ANALYZE 결과 (노드 목록, 실행 시간 ms)"""
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SET enable_seqscan = off")
+        cursor.execute("SET enable_sort = off")
+        cursor.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}", parameters)
+        result = cursor.fetchone()[0]
+        if isinstance(result, str):
+            result = json.loads(result)
+        return _plan_nodes(result[0]["Plan"]), result[0]["Execution Time"]
+    finally:
+        connection.rollback()
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서비스 쿼리의 플랜에 Seq Scan / Sort가 없는지 검사")
+    parser.add_argument("url", nargs="?", default=os.getenv("QUERY_PLAN_DATABASE_URL"), help="Postgres 접속 URL")
+    parser.add_argument("--projects", type=int, default=20000, help="합성 프로젝트 수")
+    parser.add_argument("--courses", type=int, default=2000, help="합성 강의 수")
+    parser.add_argument("--inquiries", type=int, default=20000, help="합성 문의 수")
+    parser.add_argument("--keep", action="store_true", help=f"검사 후 {SCHEMA} 스키마를 삭제하지 않음")
+    args = parser.parse_args()
+
+    if not args.url or not args.url.startswith("postgresql"):
+        print("❌ Postgres 접속 URL이 필요합니다. (인자 또는 QUERY_PLAN_DATABASE_URL)")
+        sys.exit(1)
+
+    engine = create_engine(args.url, connect_args={"options": f"-csearch_path={SCHEMA}"})
+    with engine.begin() as connection:
+        connection.exec_driver_sql(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        connection.exec_driver_sql(f"CREATE SCHEMA {SCHEMA}")
+
+    failures = 0
+    try:
+        Base.metadata.create_all(bind=engine)
+        database_dir = backend_dir.parent / "database"
+        with engine.begin() as connection:
+            for migration in MIGRATIONS:
+                connection.exec_driver_sql((database_dir / migration).read_text(encoding="utf-8"))
+
+        print(f"🚀 합성 데이터 적재: 프로젝트 {args.projects}개, 강의 {args.courses}개, 문의 {args.inquiries}개")
+        load_synthetic_data(engine, args.projects, args.courses, args.inquiries)
+
+        db = Session(bind=engine)
+        # 다른 함수가 같은 쿼리를 재사용하면 (예: 패싯 조회 전 외부 쓰기 확인용 ETag 집계)
+        # 처음 검사한 라벨의 예외를 그대로 적용
+        allowed_by_statement: Dict[str, set] = {}
+        try:
+            for label, call in service_calls(db):
+                for statement, parameters in capture_queries(engine, call):
+                    allowed = allowed_by_statement.setdefault(statement, ALLOWED_NODES.get(label, set()))
+                    nodes, elapsed = explain(engine, statement, parameters)
+                    bad = sorted({node for node in nodes if node in BAD_NODES} - allowed)
+                    mark = "❌" if bad else "✅"
+                    print(f"{mark} {label:<30} {elapsed:8.2f}ms  {' > '.join(nodes)}")
+                    if bad:
+                        failures += 1
+                        print(f"   {', '.join(bad)} 노드 발견:\n   {' '.join(statement.split())}")
+        finally:
+            db.close()
+    finally:
+        if not args.keep:
+            with engine.begin() as connection:
+                connection.exec_driver_sql(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        engine.dispose()
+
+    print("-" * 60)
+    if failures:
+        print(f"❌ {failures}개 쿼리 플랜에서 Seq Scan / Sort가 발견되었습니다.")
+        sys.exit(1)
+    print("✅ 모든 쿼리가 인덱스를 사용합니다.")
+
+
+if __name__ == "__main__":
+    main()
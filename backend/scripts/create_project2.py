@@ -1,6 +1,7 @@
 """
 프로젝트2 (priority=2) 생성 스크립트
 제공된 Bluroutine 프로젝트 데이터를 데이터베이스에 추가합니다.
+priority=2 프로젝트가 이미 있으면 변경된 컬럼만 갱신하므로 여러 번 실행해도 중복되지 않습니다.
 """
 import sys
 import os
@@ -12,7 +13,7 @@ sys.path.insert(0, str(backend_dir))
 
 from sqlalchemy.orm import Session
 from datetime import date
-from projects.service import create_project
+from projects.service import upsert_projects
 from projects.schemas import ProjectCreate, Technology, Feature, CodeSnippet
 from core.database import SessionLocal
 from core.logger import logger
@@ -218,12 +219,18 @@ def main():
     # 데이터베이스에 추가
     db = SessionLocal()
     try:
-        result = create_project(db, project_create)
-        logger.info(f"프로젝트2 (priority=2) 생성 완료: {result.title} (ID: {result.id})")
-        print(f"✅ 프로젝트2 생성 완료!")
-        print(f"   제목: {result.title}")
-        print(f"   ID: {result.id}")
-        print(f"   Priority: {result.priority}")
+        result = upsert_projects(db, [project_create])
+        if result["created"]:
+            action, project_id = "생성", result["created"][0]
+        elif result["updated"]:
+            action, project_id = "갱신", result["updated"][0]
+        else:
+            action, project_id = "변경 없음", result["unchanged"][0]
+        logger.info(f"프로젝트2 (priority=2) {action}: {project_create.title} (ID: {project_id})")
+        print(f"✅ 프로젝트2 {action}!")
+        print(f"   제목: {project_create.title}")
+        print(f"   ID: {project_id}")
+        print(f"   Priority: {project_create.priority}")
     except Exception as e:
         logger.error(f"프로젝트2 생성 실패: {str(e)}")
         print(f"❌ 프로젝트2 생성 실패: {str(e)}")
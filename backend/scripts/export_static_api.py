@@ -0,0 +1,114 @@
+"""
+정적 JSON API 내보내기 스크립트
+
+API 응답과 같은 스키마(바이트 단위로 동일한 JSON)로 frontend/public/api 아래에 파일을 생성합니다.
+프론트엔드는 CDN에서 이 파일을 먼저 읽고, API는 폴백으로만 사용할 수 있습니다.
+
+    api/projects.json        -> GET /api/projects
+    api/projects/{id}.json   -> GET /api/projects/{id}
+    api/courses.json         -> GET /api/courses
+
+내용(sha256)이 바뀐 파일만 다시 쓰므로 CDN/브라우저 캐시가 불필요하게 깨지지 않고,
+삭제된 프로젝트의 파일은 제거합니다.
+
+사용법:
+    python -m scripts.export_static_api
+    python -m scripts.export_static_api --output ../frontend/dist/api
+"""
+import argparse
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+# 프로젝트 루트를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from core.database import SessionLocal
+from core.logger import logger
+from courses.service import get_courses_snapshot
+from projects.service import get_projects, get_projects_by_ids, get_projects_snapshot
+
+DEFAULT_OUTPUT_DIR = backend_dir.parent / "frontend" / "public" / "api"
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def write_if_changed(path: Path, content: bytes) -> bool:
+    """내용 해시가 다를 때만 임시 파일에 쓴 뒤 교체 (변경되었으면 True)"""
+    if path.exists() and _digest(path.read_bytes()) == _digest(content):
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+    return True
+
+
+def build_files(db) -> Dict[str, bytes]:
+    """상대 경로 -> API 응답과 동일하게 인코딩된 JSON 바이트"""
+    files: Dict[str, bytes] = {
+        # 목록은 라우터와 같은 미리 인코딩된 스냅샷 사용
+        "projects.json": get_projects_snapshot(db),
+        "courses.json": get_courses_snapshot(db),
+    }
+
+    project_ids = [project.id for project in get_projects(db)]
+    for project in get_projects_by_ids(db, project_ids).items:
+        files[f"projects/{project.id}.json"] = project.model_dump_json(by_alias=True).encode("utf-8")
+
+    return files
+
+
+def export_static_api(db, output_dir: Path) -> Dict[str, Any]:
+    """
+    정적 JSON 파일을 output_dir에 동기화
+
+    Returns:
+        {"written": [...], "unchanged": int, "removed": [...]} (경로는 output_dir 기준)
+    """
+    files = build_files(db)
+    written = [name for name, content in files.items() if write_if_changed(output_dir / name, content)]
+
+    removed = []
+    projects_dir = output_dir / "projects"
+    if projects_dir.exists():
+        for path in projects_dir.glob("*.json"):
+            name = f"projects/{path.name}"
+            if name not in files:
+                path.unlink()
+                removed.append(name)
+
+    return {"written": written, "unchanged": len(files) - len(written), "removed": removed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 응답을 정적 JSON 파일로 내보내기")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_DIR, help="출력 디렉터리")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        result = export_static_api(db, args.output)
+        for name in result["written"]:
+            print(f"   ✏️ {name}")
+        for name in result["removed"]:
+            print(f"   🗑️ {name}")
+        print(
+            f"✅ 정적 API 내보내기 완료: {args.output} "
+            f"(변경 {len(result['written'])}개, 유지 {result['unchanged']}개, 삭제 {len(result['removed'])}개)"
+        )
+    except Exception as e:
+        logger.error(f"정적 API 내보내기 실패: {str(e)}")
+        print(f"❌ 정적 API 내보내기 실패: {str(e)}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+프로젝트 일괄 가져오기 스크립트
+
+JSON(배열, {"projects": [...]}, data/portfolio_data.json 형식) 또는 NDJSON 파일의
+프로젝트를 청크 단위로 검증하고 다중 행 INSERT로 추가합니다.
+--upsert를 주면 priority를 자연 키로 새 프로젝트만 추가하고 변경된 프로젝트만 갱신하므로
+같은 파일을 여러 번 실행해도 중복이 생기지 않습니다.
+검증/INSERT에 실패한 레코드는 번호와 함께 오류로 출력하고 나머지는 계속 진행합니다.
+
+사용법:
+    python -m scripts.import_projects ../data/portfolio_data.json
+    python -m scripts.import_projects projects.ndjson --chunk-size 200
+    python -m scripts.import_projects ../data/portfolio_data.json --upsert
+    python -m scripts.import_projects projects.ndjson --dry-run   # 검증만
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from core.database import SessionLocal
+from core.logger import logger
+from projects.importer import DEFAULT_CHUNK_SIZE, import_projects
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON/NDJSON 파일에서 프로젝트 일괄 가져오기")
+    parser.add_argument("path", type=Path, help="JSON 또는 NDJSON(.ndjson/.jsonl) 파일 경로")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="한 번에 INSERT할 레코드 수")
+    parser.add_argument("--upsert", action="store_true", help="priority 기준으로 추가/변경분만 갱신")
+    parser.add_argument("--dry-run", action="store_true", help="검증만 하고 추가하지 않음")
+    args = parser.parse_args()
+
+    if not args.path.exists():
+        print(f"❌ 파일을 찾을 수 없습니다: {args.path}")
+        sys.exit(1)
+
+    db = SessionLocal()
+    try:
+        report = import_projects(
+            db,
+            args.path,
+            chunk_size=max(args.chunk_size, 1),
+            dry_run=args.dry_run,
+            upsert=args.upsert
+        )
+
+        for number, error in report.errors:
+            print(f"   ⚠️ 레코드 {number}: {error}")
+
+        if args.dry_run:
+            print(f"유효 레코드: {report.valid}개, 오류: {len(report.errors)}개 (dry-run, 추가하지 않음)")
+        elif args.upsert:
+            print(
+                f"✅ 추가 {len(report.created)}개, 갱신 {len(report.updated)}개, "
+                f"변경 없음 {len(report.unchanged)}개 (오류 {len(report.errors)}개)"
+            )
+        else:
+            print(f"✅ {len(report.created)}개 프로젝트를 추가했습니다. (오류 {len(report.errors)}개)")
+
+        if report.errors:
+            sys.exit(1)
+    except Exception as e:
+        logger.error(f"프로젝트 가져오기 실패: {str(e)}")
+        print(f"❌ 프로젝트 가져오기 실패: {str(e)}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
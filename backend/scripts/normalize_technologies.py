@@ -0,0 +1,45 @@
+"""
+technologies 정규화 백필 스크립트
+
+저장된 projects.technologies 중 레거시 형태(문자열 배열, {name, category} 배열)를
+{category, items} 형태로 한 번에 변환합니다. 읽기 경로는 검증에 실패한 행만 변환하는
+느린 경로로 처리하므로 배포 전에 한 번 실행해야 합니다.
+변환할 수 없는 행이 하나라도 있으면 아무것도 커밋하지 않고 0이 아닌 코드로 종료합니다.
+
+사용법:
+    python -m scripts.normalize_technologies            # 변환 후 커밋
+    python -m scripts.normalize_technologies --dry-run  # 변환 대상만 출력
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from core.database import SessionLocal
+from core.logger import logger
+from projects.service import backfill_technologies
+
+
+def main():
+    dry_run = "--dry-run" in sys.argv[1:]
+    
+    db = SessionLocal()
+    try:
+        count = backfill_technologies(db, dry_run=dry_run)
+        if dry_run:
+            print(f"변환 대상 프로젝트: {count}개 (dry-run, 커밋하지 않음)")
+        else:
+            print(f"✅ {count}개 프로젝트의 technologies를 변환했습니다.")
+    except Exception as e:
+        logger.error(f"technologies 변환 실패: {str(e)}")
+        print(f"❌ technologies 변환 실패: {str(e)}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+-- ============================================
+-- 강의 카운터 flush token 테이블 마이그레이션
+-- Supabase에서 실행
+-- ============================================
+
+-- 수강생/리뷰/평점 증가분(courses.counters)을 일괄 UPDATE할 때 같은 트랜잭션에 token을 기록
+-- 재시작 후 저널을 다시 반영할 때 이미 반영된 묶음을 건너뛰어 두 번 더해지지 않도록 함
+CREATE TABLE IF NOT EXISTS course_counter_flushes (
+    id VARCHAR(64) PRIMARY KEY,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- 오래된 token 정리(created_at < now() - 7일)용
+CREATE INDEX IF NOT EXISTS idx_course_counter_flushes_created_at
+    ON course_counter_flushes (created_at);
@@ -0,0 +1,13 @@
+-- ============================================
+-- 강의 커리큘럼 통계 컬럼 마이그레이션
+-- Supabase에서 실행
+-- ============================================
+
+-- curriculum JSON에서 쓰기 시점에 계산해 저장하는 통계
+-- 목록 응답에서 curriculum 없이 레슨 수/무료 레슨 수/총 재생 시간을 보여주기 위해 사용
+ALTER TABLE courses ADD COLUMN IF NOT EXISTS lesson_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE courses ADD COLUMN IF NOT EXISTS free_lesson_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE courses ADD COLUMN IF NOT EXISTS total_duration_seconds INTEGER NOT NULL DEFAULT 0;
+
+-- 기존 강의의 통계는 백엔드에서 계산해 채움:
+--   python -m scripts.backfill_course_stats
@@ -0,0 +1,9 @@
+-- ============================================
+-- 강의 목록 정렬 인덱스 마이그레이션
+-- Supabase에서 실행
+-- ============================================
+
+-- GET /api/courses (ORDER BY created_at DESC)
+-- 정렬 없이 인덱스 순서대로 읽도록 id를 포함한 복합 인덱스
+CREATE INDEX IF NOT EXISTS idx_courses_created_at
+    ON courses (created_at DESC, id DESC);
@@ -0,0 +1,17 @@
+-- ============================================
+-- 문의 관리자 목록 인덱스 마이그레이션
+-- Supabase에서 실행
+-- ============================================
+
+-- GET /api/inquiries (ORDER BY created_at DESC, id DESC + 키셋 커서)
+-- 정렬 없이 인덱스 순서대로 읽고 커서 이후 행으로 바로 이동하도록 id를 포함한 복합 인덱스
+CREATE INDEX IF NOT EXISTS idx_inquiries_created_at
+    ON inquiries (created_at DESC, id DESC);
+
+-- ?status= 필터 (대기 중인 문의 분류)
+CREATE INDEX IF NOT EXISTS idx_inquiries_status_created_at
+    ON inquiries (status, created_at DESC, id DESC);
+
+-- ?service_type= 필터
+CREATE INDEX IF NOT EXISTS idx_inquiries_service_type_created_at
+    ON inquiries (service_type, created_at DESC, id DESC);
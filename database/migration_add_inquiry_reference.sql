@@ -0,0 +1,10 @@
+-- ============================================
+-- 문의 reference 컬럼 마이그레이션
+-- Supabase에서 실행
+-- ============================================
+
+-- 클라이언트에 돌려주는 문의 식별자
+-- 큐 모드(INQUIRY_QUEUE_ENABLED)에서 워커가 같은 문의를 두 번 INSERT하지 않도록 유니크 키로 사용
+ALTER TABLE inquiries ADD COLUMN IF NOT EXISTS reference VARCHAR(36);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_inquiries_reference ON inquiries (reference);
@@ -0,0 +1,13 @@
+-- ============================================
+-- 프로젝트 목록 정렬 인덱스 마이그레이션
+-- Supabase에서 실행
+-- ============================================
+
+-- GET /api/projects 키셋 페이지네이션
+-- ORDER BY priority DESC, created_at DESC, id DESC 순서와 동일한 복합 인덱스
+CREATE INDEX IF NOT EXISTS idx_projects_list_order
+    ON projects (priority DESC, created_at DESC, id DESC);
+
+-- project_type 필터가 있는 경우
+CREATE INDEX IF NOT EXISTS idx_projects_type_list_order
+    ON projects (project_type, priority DESC, created_at DESC, id DESC);
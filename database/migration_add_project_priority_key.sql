@@ -0,0 +1,14 @@
+-- ============================================
+-- 프로젝트 priority 자연 키 마이그레이션
+-- Supabase에서 실행
+-- ============================================
+
+-- 시딩/가져오기 스크립트의 upsert(INSERT ... ON CONFLICT (priority) WHERE priority > 0) 대상
+-- priority 0은 "미지정"으로 보고 중복을 허용하는 부분 유니크 인덱스
+
+-- 실행 전 중복 확인 (결과가 있으면 priority를 먼저 정리)
+-- SELECT priority, COUNT(*) FROM projects WHERE priority > 0 GROUP BY priority HAVING COUNT(*) > 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_projects_priority
+    ON projects (priority)
+    WHERE priority > 0;
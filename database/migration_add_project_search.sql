@@ -0,0 +1,38 @@
+-- ============================================
+-- 프로젝트 전문 검색(Full-text search) 마이그레이션
+-- Supabase에서 실행
+-- ============================================
+
+-- 검색 문서 생성 함수
+-- title(A) > subtitle, tags, technologies.items(B) > description(C) 가중치
+-- 한국어 형태소 사전이 없으므로 'simple' 설정을 사용하고, 조회 시 접두어(:*) 매칭으로 조사를 흡수합니다.
+-- GIN 인덱스에 사용하기 위해 IMMUTABLE로 선언합니다.
+CREATE OR REPLACE FUNCTION projects_search_vector(
+    title TEXT,
+    subtitle TEXT,
+    description TEXT,
+    tags JSON,
+    technologies JSON
+) RETURNS tsvector
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(subtitle, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce((
+            SELECT string_agg(tag, ' ')
+            FROM json_array_elements_text(coalesce(tags, '[]'::json)) AS tag
+        ), '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce((
+            SELECT string_agg(item, ' ')
+            FROM json_array_elements(coalesce(technologies, '[]'::json)) AS tech,
+                 json_array_elements_text(coalesce(tech -> 'items', '[]'::json)) AS item
+        ), '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'C')
+$$;
+
+-- GIN 표현식 인덱스 (projects.service.search_projects의 WHERE 절과 동일한 표현식이어야 사용됨)
+CREATE INDEX IF NOT EXISTS idx_projects_search
+    ON projects
+    USING GIN (projects_search_vector(title, subtitle, description, tags, technologies));